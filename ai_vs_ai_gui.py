@@ -2,6 +2,9 @@ import pygame
 import sys
 import random
 import time
+import queue
+import threading
+from collections import deque
 import matplotlib
 matplotlib.use("TkAgg")
 import matplotlib.pyplot as plt
@@ -9,7 +12,7 @@ from matplotlib.backends.backend_agg import FigureCanvasAgg
 import numpy as np
 # Local project imports (must exist in your project)
 from multiplayer_game import MultiplayerGame
-from ql_agent import RandomAgent, HeuristicAgent, QLearningAgent
+from ql_agent import RandomAgent, HeuristicAgent, QLearningAgent, MODEL_FILE
 from uno_game import Color, CardType
 
 # Initialize pygame modules
@@ -37,6 +40,30 @@ CYAN = (0, 255, 255)
 CARD_WIDTH = 80
 CARD_HEIGHT = 120
 CARD_RADIUS = 10
+# Color key for the corners outside a card's rounded rect (no card pixel uses it)
+CARD_KEY = (255, 0, 255)
+
+# Above this share of the window, one full flip is cheaper than a list of dirty rects
+FULL_FLIP_AREA = 0.5
+
+# Center label for non-number cards
+CARD_TYPE_LABELS = {
+    CardType.SKIP: "Skip",
+    CardType.REVERSE: "Rev",
+    CardType.DRAW_TWO: "+2",
+    CardType.WILD: "Wild",
+    CardType.WILD_DRAW_FOUR: "+4"
+}
+
+# Custom events: the move timer, and "the worker thread decided a move"
+MOVE_EVENT = pygame.USEREVENT + 1
+AI_DECIDED_EVENT = pygame.USEREVENT + 2
+
+
+def monotonic_ms():
+    """Milliseconds from a monotonic clock (unaffected by system clock changes)."""
+    return time.monotonic_ns() // 1_000_000
+
 
 # -------------------- GUI class --------------------
 class AIVsAIGUI:
@@ -64,7 +91,12 @@ class AIVsAIGUI:
         # Pygame window and fonts
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("SMART UNO - RL AGENT")
-        self.clock = pygame.time.Clock()
+        # Only queue the events run() handles; mouse motion etc. would otherwise
+        # wake the event-driven loop for nothing
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                  MOVE_EVENT, AI_DECIDED_EVENT])
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
         self.tiny_font = pygame.font.Font(None, 18)
@@ -80,7 +112,7 @@ class AIVsAIGUI:
                 # Q-Learning agent as player 1
                 agent = QLearningAgent(name=f"Q-Agent-{i+1}")
                 try:
-                    agent.load_model()
+                    agent.load_model(MODEL_FILE)
                 except Exception:
                     # If load fails, it's non-fatal — agent should still function
                     pass
@@ -100,19 +132,63 @@ class AIVsAIGUI:
         self.speeds = [0.1, 0.25, 0.5, 1.0, 2.0]
         self.game_speed = 0.5  # default start speed (you can change)
         self.move_delay = max(10, int(self.base_delay_unit_ms / self.game_speed))
-        self.last_move_time = pygame.time.get_ticks()
+        # Frame timestamp (ms), read once per loop iteration in run()
+        self.now_ms = monotonic_ms()
+        self.last_move_time = self.now_ms
+        # Whether the MOVE_EVENT timer is running, see set_move_timer()
+        self._move_timer_on = False
+
+        # ---- AI worker thread ----
+        # Agents decide on a background thread (see _ai_worker); the main loop applies
+        # the moves, so the game engine is only ever mutated from one thread.
+        self._move_requests = queue.Queue()
+        self._move_queue = queue.Queue(maxsize=4)
+        self._agent_lock = threading.Lock()
+        self._move_token = 0          # id of the most recently requested move
+        self._awaiting_move = False   # True while the worker owes us a move
+        self._ai_thread = None
 
         # ---- UI toggles ----
         # Remove playable-card highlight by default as requested
         self.enable_highlight = False
 
+        # ---- Render caches ----
+        # Pre-rendered card Surfaces keyed by (card_type, number, color);
+        # all face-down cards share the `None` entry.
+        self._card_surface_cache = {}
+        # Orange highlight drawn under a card (built on first use)
+        self._highlight_surf = None
+        # Rendered text Surfaces keyed by (text, font, color), see _text()
+        self._text_cache = {}
+        # Per-player (hand, hand version, face_up, blit list, rect) from get_hand_blits;
+        # MultiplayerGame bumps hand_versions[p] whenever hand p changes
+        self._hand_blits = [None] * num_players
+        # Player labels are blitted in pieces, "P1 (Name): " + count + " cards",
+        # so only the pre-rendered count changes (108 cards = largest possible hand)
+        self._label_prefix_surfs = [
+            self.small_font.render(f"P{i+1} ({self.agent_names[i]}): ", True, WHITE).convert_alpha()
+            for i in range(num_players)
+        ]
+        self._label_count_surfs = [self.small_font.render(str(n), True, WHITE).convert_alpha()
+                                   for n in range(109)]
+        self._label_suffix_surf = self.small_font.render(" cards", True, WHITE).convert_alpha()
+
         # ---- Notifications & action effects ----
+        # Messages are shown until a deadline in self.now_ms time
         self.notification = ""
-        self.notification_timer = 0
+        self.notification_expires = 0
         self.notification_color = WHITE
 
         self.action_effect = ""
-        self.action_effect_timer = 0
+        self.action_effect_expires = 0
+
+        # ---- Redraw gating ----
+        # Only redraw (and flip) when something visible changed
+        self._dirty = True
+        # Dirty rectangles: what the last frame drew on top of the background,
+        # and whether the next frame has to repaint/flip the whole window
+        self._dirty_rects = []
+        self._full_redraw = True
 
         # ---- Buttons: top bar layout (aligned & consistent) ----
         top_y = 18
@@ -140,11 +216,25 @@ class AIVsAIGUI:
             CARD_WIDTH, CARD_HEIGHT
         )
 
+        # Static table/buttons/deck background, blitted once per frame
+        self._deck_back_surf = None
+        self._static_bg = None
+        # Rendered stats box and the (turns, hand sizes) it shows, see draw_stats()
+        self._stats_surf = None
+        self._stats_key = None
+        self._build_static_bg()
+        # Black dimming layer for the game-over screen, allocated once
+        self._game_over_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._game_over_overlay.fill(BLACK)
+        self._game_over_overlay.set_alpha(200)
+
         # ---- UNO rule GUI-level state ----
         # Track whether player has called UNO (True/False)
-        self.uno_called = {i: False for i in range(num_players)}
-        # Track when player reached 1 card (ms timestamp) to allow catch window
-        self.uno_time = {i: None for i in range(num_players)}
+        self.uno_called = [False] * num_players
+        # Track when player reached 1 card (ms timestamp, -1 = not tracking) to allow catch window
+        self.uno_time = [-1] * num_players
+        # Missed UNO calls waiting to be caught: (deadline_ms, player), oldest first
+        self._pending_uno = deque()
         # How long (ms) other players have to catch a missed UNO
         self.uno_catch_window_ms = 1500  # 1.5 seconds
         # Probability an AI will "remember" to call UNO automatically
@@ -154,58 +244,109 @@ class AIVsAIGUI:
 
     # -------------------- Small UI helpers --------------------
     def show_notification(self, message, color=WHITE, duration=120):
-        """Display a centered notification for `duration` frames."""
+        """
+        Display a centered notification for `duration` frames' worth of time.
+        The duration is converted to a wall-clock deadline so the message does not
+        depend on how often the screen is redrawn.
+        """
         self.notification = message
         self.notification_color = color
-        self.notification_timer = duration
+        self.notification_expires = self.now_ms + duration * 1000 // FPS
+        self._dirty = True
 
     def show_action_effect(self, message, duration=180):
-        """Display a small action effect message near bottom center."""
+        """Display a small action effect message near bottom center (see show_notification)."""
         self.action_effect = message
-        self.action_effect_timer = duration
+        self.action_effect_expires = self.now_ms + duration * 1000 // FPS
+        self._dirty = True
+
+    def expire_messages(self, now_ms):
+        """Clear notifications whose deadline passed; clearing one needs a redraw."""
+        if self.notification and now_ms >= self.notification_expires:
+            self.notification = ""
+            self._dirty = True
+        if self.action_effect and now_ms >= self.action_effect_expires:
+            self.action_effect = ""
+            self._dirty = True
+
+    def _text(self, text, font, color):
+        """
+        Return `text` rendered with `font` in `color`, rasterizing each distinct
+        (text, font, color) combination only once.
+        """
+        key = (text, font, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Labels such as "Turns: N" keep producing new strings; start over
+            # rather than letting the cache grow for the whole session.
+            if len(self._text_cache) >= 512:
+                self._text_cache.clear()
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
 
     # -------------------- Drawing helpers --------------------
-    def draw_card(self, card, x, y, face_up=True, highlight=False):
+    def _build_card_surface(self, card, face_up):
         """
-        Draw a single card.
-        - If `face_up` is False we draw a gray back.
-        - Highlighting is disabled globally with self.enable_highlight.
+        Render one card (outline, colored inner box and label) onto an offscreen
+        Surface. Called once per distinct card face; draw_card only blits the result.
         """
+        surf = pygame.Surface((CARD_WIDTH, CARD_HEIGHT)).convert()
+        surf.fill(CARD_KEY)
         color = WHITE if face_up else GRAY
 
-        # Only draw highlight if both requested and enabled
-        if highlight and self.enable_highlight:
-            pygame.draw.rect(self.screen, ORANGE,
-                             (x - 4, y - 4, CARD_WIDTH + 8, CARD_HEIGHT + 8),
-                             border_radius=CARD_RADIUS)
-
-        pygame.draw.rect(self.screen, color, (x, y, CARD_WIDTH, CARD_HEIGHT),
+        pygame.draw.rect(surf, color, (0, 0, CARD_WIDTH, CARD_HEIGHT),
                          border_radius=CARD_RADIUS)
-        pygame.draw.rect(self.screen, BLACK, (x, y, CARD_WIDTH, CARD_HEIGHT),
+        pygame.draw.rect(surf, BLACK, (0, 0, CARD_WIDTH, CARD_HEIGHT),
                          width=2, border_radius=CARD_RADIUS)
 
         if face_up:
             # Small inner rectangle colored according to card color for easy identification
             card_color = card.get_color_rgb()
-            pygame.draw.rect(self.screen, card_color,
-                             (x + 10, y + 10, CARD_WIDTH - 20, CARD_HEIGHT - 20),
+            pygame.draw.rect(surf, card_color,
+                             (10, 10, CARD_WIDTH - 20, CARD_HEIGHT - 20),
                              border_radius=5)
 
             # Card center text (number or action)
             if card.card_type == CardType.NUMBER:
                 text = str(card.number)
             else:
-                mapping = {
-                    CardType.SKIP: "Skip",
-                    CardType.REVERSE: "Rev",
-                    CardType.DRAW_TWO: "+2",
-                    CardType.WILD: "Wild",
-                    CardType.WILD_DRAW_FOUR: "+4"
-                }
-                text = mapping.get(card.card_type, "?")
+                text = CARD_TYPE_LABELS.get(card.card_type, "?")
             text_surface = self.font.render(text, True, WHITE)
-            text_rect = text_surface.get_rect(center=(x + CARD_WIDTH // 2, y + CARD_HEIGHT // 2))
-            self.screen.blit(text_surface, text_rect)
+            text_rect = text_surface.get_rect(center=(CARD_WIDTH // 2, CARD_HEIGHT // 2))
+            surf.blit(text_surface, text_rect)
+
+        # Opaque in the display format, corners keyed out: later blits skip per-pixel alpha
+        surf.set_colorkey(CARD_KEY, pygame.RLEACCEL)
+        return surf
+
+    def get_card_surface(self, card, face_up=True):
+        """Return the cached Surface for `card`, building it on first use."""
+        # Every card back looks the same, so they all share the `None` entry
+        key = (card.card_type, card.number, card.color) if face_up else None
+        surf = self._card_surface_cache.get(key)
+        if surf is None:
+            surf = self._build_card_surface(card, face_up)
+            self._card_surface_cache[key] = surf
+        return surf
+
+    def draw_card(self, card, x, y, face_up=True, highlight=False):
+        """
+        Draw a single card by blitting its cached Surface.
+        - If `face_up` is False we draw a gray back.
+        - Highlighting is disabled globally with self.enable_highlight.
+        """
+        # Only draw highlight if both requested and enabled
+        if highlight and self.enable_highlight:
+            if self._highlight_surf is None:
+                self._highlight_surf = pygame.Surface((CARD_WIDTH + 8, CARD_HEIGHT + 8), pygame.SRCALPHA)
+                pygame.draw.rect(self._highlight_surf, ORANGE,
+                                 (0, 0, CARD_WIDTH + 8, CARD_HEIGHT + 8),
+                                 border_radius=CARD_RADIUS)
+                self._highlight_surf = self._highlight_surf.convert_alpha()
+            self.screen.blit(self._highlight_surf, (x - 4, y - 4))
+
+        self.screen.blit(self.get_card_surface(card, face_up), (x, y))
 
     def compute_hand_layout(self, player_index):
         """
@@ -255,29 +396,54 @@ class AIVsAIGUI:
         
         return start_x, y, spacing
 
+    def get_hand_blits(self, player_index, face_up=True):
+        """
+        (blit sequence, covered Rect) for the player's hand in the corner-based
+        layout, or None for an empty hand. Don't modify the returned objects.
+        """
+        hand = self.game.hands[player_index]
+        if len(hand) == 0:
+            return None
+
+        # While the hand list and its version are unchanged, last frame's blit list
+        # is reused (reset() deals new lists, so the versions may start over)
+        version = self.game.hand_versions[player_index]
+        cached = self._hand_blits[player_index]
+        if (cached is None or cached[0] is not hand or cached[1] != version
+                or cached[2] != face_up):
+            start_x, y, spacing = self.compute_hand_layout(player_index)
+            get_surface = self.get_card_surface
+            blit_seq = [(get_surface(card, face_up), (start_x + i * spacing, y))
+                        for i, card in enumerate(hand)]
+            # Include the (optional) highlight margin around the cards
+            rect = pygame.Rect(start_x - 4, y - 4,
+                               CARD_WIDTH + (len(hand) - 1) * spacing + 8, CARD_HEIGHT + 8)
+            cached = self._hand_blits[player_index] = (hand, version, face_up, blit_seq, rect)
+        return cached[3], cached[4]
+
     def draw_player_hand(self, player_index, face_up=True):
         """
         Draw the player's hand using corner-based layout.
         Note: For AI vs AI we show all hands face-up for observation.
+        Returns the screen area covered by the hand (None for an empty hand).
         """
-        hand = self.game.hands[player_index]
-        if len(hand) == 0:
-            return
-        
-        start_x, y, spacing = self.compute_hand_layout(player_index)
-        
-        for i, card in enumerate(hand):
-            x = start_x + i * spacing
-            self.draw_card(card, x, y, face_up=face_up, highlight=False)
+        hand_blits = self.get_hand_blits(player_index, face_up)
+        if hand_blits is None:
+            return None
+        # Hand the whole row of cached card Surfaces to pygame in a single call
+        self.screen.blits(hand_blits[0], doreturn=False)
+        return hand_blits[1].copy()
 
     def draw_discard_pile(self):
         """
-        Draws:
-          - Deck (face-down visual)
-          - Central UNO circle
+        Draws the dynamic part of the discard area:
           - Deck count
           - Top-of-discard (face-up)
-          - White info box (current color and pending draw)
+          - Current color text inside the white info box
+          - Pending draw box
+        Returns the list of screen rects it drew on.
+        The deck (face-down visual), its UNO circle and the white box itself are
+        static and live in the background built by _build_static_bg().
         Explanation of the white box (explicit):
           - The white rounded rectangle below the discard shows the CURRENT ACTIVE COLOR
             (this is important after a Wild or Wild Draw Four). It helps viewers know
@@ -289,72 +455,131 @@ class AIVsAIGUI:
         x = WINDOW_WIDTH // 2 - CARD_WIDTH - 20
         y = WINDOW_HEIGHT // 2 - CARD_HEIGHT // 2
 
-        # Draw deck (face-down) on the left of the discard area
-        deck_color = (50, 50, 50)
-        pygame.draw.rect(self.screen, deck_color,
-                         (x - 100, y, CARD_WIDTH, CARD_HEIGHT),
-                         border_radius=CARD_RADIUS)
-        pygame.draw.rect(self.screen, BLACK,
-                         (x - 100, y, CARD_WIDTH, CARD_HEIGHT),
-                         width=3, border_radius=CARD_RADIUS)
-
-        # Decorative UNO circle on deck (spectator cue)
-        center_x = x - 100 + CARD_WIDTH // 2
-        center_y = y + CARD_HEIGHT // 2
-        pygame.draw.circle(self.screen, (220, 20, 60), (center_x, center_y), 28)
-        pygame.draw.circle(self.screen, BLACK, (center_x, center_y), 28, 2)
-        uno_text = self.small_font.render("UNO", True, WHITE)
-        uno_rect = uno_text.get_rect(center=(center_x, center_y))
-        self.screen.blit(uno_text, uno_rect)
-
         # Deck count label
-        deck_count = self.tiny_font.render(f"{len(self.game.deck)} cards", True, WHITE)
-        self.screen.blit(deck_count, (x - 95, y + CARD_HEIGHT + 5))
+        deck_count = self._text(f"{len(self.game.deck)} cards", self.tiny_font, WHITE)
 
-        # Draw the top card (face-up)
-        self.draw_card(top_card, x + 20, y, face_up=True)
-
-        # White info box: shows the current active color
+        # Text for the white info box: shows the current active color
         info_y = y + CARD_HEIGHT + 30
-        color_bg = pygame.Rect(x - 10, info_y, 180, 30)
-        pygame.draw.rect(self.screen, WHITE, color_bg, border_radius=6)
-        pygame.draw.rect(self.screen, BLACK, color_bg, width=2, border_radius=6)
-        color_name = getattr(self.game.current_color, "name", str(self.game.current_color))
-        color_text = self.small_font.render(f"Color: {color_name}", True, BLACK)
-        self.screen.blit(color_text, (x, info_y + 5))
+        color_name = self.game.current_color.name
+        color_text = self._text(f"Color: {color_name}", self.small_font, BLACK)
+
+        # None of these overlap, so blit the deck label, the top card (face-up)
+        # and the info-box text together in one call
+        rects = self.screen.blits([
+            (deck_count, (x - 95, y + CARD_HEIGHT + 5)),
+            (self.get_card_surface(top_card, True), (x + 20, y)),
+            (color_text, (x, info_y + 5)),
+        ])
 
         # Pending draw indicator (if present) — shows accumulated +2/+4 penalties
-        pending_draw = getattr(self.game, "pending_draw", 0)
+        pending_draw = self.game.pending_draw
         if pending_draw > 0:
             pending_bg = pygame.Rect(x - 10, info_y + 40, 180, 30)
             pygame.draw.rect(self.screen, RED, pending_bg, border_radius=6)
             pygame.draw.rect(self.screen, BLACK, pending_bg, width=2, border_radius=6)
-            pending_text = self.small_font.render(f"+{pending_draw} PENDING!", True, WHITE)
+            pending_text = self._text(f"+{pending_draw} PENDING!", self.small_font, WHITE)
             self.screen.blit(pending_text, (x, info_y + 45))
+            rects.append(pending_bg)
+        return rects
 
-    def draw_button(self, rect, text, color=DARK_GREEN, enabled=True):
-        """Draws a rounded button with either one or two lines of text centered."""
+    def draw_button(self, rect, text, color=DARK_GREEN, enabled=True, target=None):
+        """
+        Draws a rounded button with either one or two lines of text centered.
+        `target` is the Surface to draw on (defaults to the screen).
+        """
+        target = self.screen if target is None else target
         btn_color = color if enabled else GRAY
-        pygame.draw.rect(self.screen, btn_color, rect, border_radius=6)
-        pygame.draw.rect(self.screen, BLACK, rect, width=2, border_radius=6)
+        pygame.draw.rect(target, btn_color, rect, border_radius=6)
+        pygame.draw.rect(target, BLACK, rect, width=2, border_radius=6)
 
         lines = text.split('\n')
         if len(lines) == 1:
-            text_surface = self.small_font.render(text, True, WHITE)
+            text_surface = self._text(text, self.small_font, WHITE)
             text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
+            target.blit(text_surface, text_rect)
         else:
             # center multi-line text slightly shifted upwards
             for i, line in enumerate(lines):
-                text_surface = self.tiny_font.render(line, True, WHITE)
+                text_surface = self._text(line, self.tiny_font, WHITE)
                 text_rect = text_surface.get_rect(center=(rect.centerx, rect.centery - 8 + i * 18))
-                self.screen.blit(text_surface, text_rect)
+                target.blit(text_surface, text_rect)
 
-    def draw_stats(self):
-        """Draws right-side stats box containing turns and player card counts."""
-        pygame.draw.rect(self.screen, WHITE, self.stats_rect, border_radius=8)
-        pygame.draw.rect(self.screen, BLACK, self.stats_rect, width=2, border_radius=8)
+    def _build_deck_back_surf(self):
+        """The face-down deck with its decorative UNO circle, as one card-sized Surface."""
+        surf = pygame.Surface((CARD_WIDTH, CARD_HEIGHT)).convert()
+        surf.fill(CARD_KEY)
+        deck_color = (50, 50, 50)
+        pygame.draw.rect(surf, deck_color,
+                         (0, 0, CARD_WIDTH, CARD_HEIGHT),
+                         border_radius=CARD_RADIUS)
+        pygame.draw.rect(surf, BLACK,
+                         (0, 0, CARD_WIDTH, CARD_HEIGHT),
+                         width=3, border_radius=CARD_RADIUS)
+
+        # Decorative UNO circle on deck (spectator cue)
+        center = (CARD_WIDTH // 2, CARD_HEIGHT // 2)
+        pygame.draw.circle(surf, (220, 20, 60), center, 28)
+        pygame.draw.circle(surf, BLACK, center, 28, 2)
+        uno_text = self._text("UNO", self.small_font, WHITE)
+        surf.blit(uno_text, uno_text.get_rect(center=center))
+        surf.set_colorkey(CARD_KEY, pygame.RLEACCEL)
+        return surf
+
+    def _build_static_bg(self):
+        """
+        Compose everything that does not change between moves into
+        self._static_bg: the green table, all buttons, the face-down deck with
+        its UNO circle, the stats box frame and the white color-info box.
+        run() blits this once per frame instead of redrawing each piece.
+        Only the SPEED button label depends on state, so toggle_speed() rebuilds it.
+        """
+        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        bg.fill(GREEN)
+
+        # Buttons (text included)
+        self.draw_button(self.plot_button_rect, "PLOT GRAPHS", ORANGE, target=bg)
+        self.draw_button(self.back_button_rect, "BACK", PURPLE, target=bg)
+        self.draw_button(self.end_game_button_rect, "END GAME", RED, target=bg)
+        self.draw_button(self.new_game_button_rect, "NEW GAME", DARK_GREEN, target=bg)
+        self.draw_button(self.speed_button_rect, f"SPEED\n{self.game_speed}x", CYAN, target=bg)
+
+        # Deck (face-down) on the left of the discard area
+        x = WINDOW_WIDTH // 2 - CARD_WIDTH - 20
+        y = WINDOW_HEIGHT // 2 - CARD_HEIGHT // 2
+        if self._deck_back_surf is None:
+            self._deck_back_surf = self._build_deck_back_surf()
+        bg.blit(self._deck_back_surf, (x - 100, y))
+
+        # White info box frame (its "Color: ..." text is drawn per frame)
+        info_y = y + CARD_HEIGHT + 30
+        color_bg = pygame.Rect(x - 10, info_y, 180, 30)
+        pygame.draw.rect(bg, WHITE, color_bg, border_radius=6)
+        pygame.draw.rect(bg, BLACK, color_bg, width=2, border_radius=6)
+
+        # Stats box frame (its lines are drawn per frame)
+        pygame.draw.rect(bg, WHITE, self.stats_rect, border_radius=8)
+        pygame.draw.rect(bg, BLACK, self.stats_rect, width=2, border_radius=8)
+
+        self._static_bg = bg
+        # The stats box is cut out of the background, so re-render it too
+        self._stats_key = None
+        self._full_redraw = True
 
+    def draw_stats(self):
+        """
+        Blits the stats box (turns and player card counts) and returns its rect.
+        The box is rendered into self._stats_surf and only rebuilt when one of
+        those numbers changed.
+        """
+        key = (self.game.turns_played, tuple(len(hand) for hand in self.game.hands))
+        if key != self._stats_key:
+            self._rebuild_stats_surface()
+            self._stats_key = key
+        return self.screen.blit(self._stats_surf, self.stats_rect.topleft)
+
+    def _rebuild_stats_surface(self):
+        """Render the stats lines onto a copy of the background under the stats box."""
+        surf = self._static_bg.subsurface(self.stats_rect).copy()
         stats_lines = [
             "Game Stats:",
             f"Turns: {self.game.turns_played}",
@@ -367,13 +592,14 @@ class AIVsAIGUI:
             stats_lines.append(f"  ({self.agent_names[i]})")
 
         for i, line in enumerate(stats_lines):
-            text = self.tiny_font.render(line, True, BLACK)
-            self.screen.blit(text, (self.stats_rect.x + 10, self.stats_rect.y + 8 + i * 18))
+            text = self._text(line, self.tiny_font, BLACK)
+            surf.blit(text, (10, 8 + i * 18))
+        self._stats_surf = surf
 
     def draw_notification(self):
-        """Center-top notification box with countdown (frame-based)."""
-        if self.notification_timer > 0:
-            text_surface = self.font.render(self.notification, True, BLACK)
+        """Center-top notification box (cleared by expire_messages). Returns the box rect, if drawn."""
+        if self.notification:
+            text_surface = self._text(self.notification, self.font, BLACK)
             text_rect = text_surface.get_rect()
 
             box_width = text_rect.width + 40
@@ -387,12 +613,13 @@ class AIVsAIGUI:
 
             text_rect.center = (WINDOW_WIDTH // 2, box_y + box_height // 2)
             self.screen.blit(text_surface, text_rect)
-            self.notification_timer -= 1
+            return bg_rect
+        return None
 
     def draw_action_effect(self):
-        """Small action effect (e.g., +2 played) near bottom center with countdown."""
-        if self.action_effect_timer > 0:
-            text_surface = self.small_font.render(self.action_effect, True, WHITE)
+        """Small action effect (e.g., +2 played) near bottom center (cleared by expire_messages). Returns the box rect, if drawn."""
+        if self.action_effect:
+            text_surface = self._text(self.action_effect, self.small_font, WHITE)
             text_rect = text_surface.get_rect()
 
             box_width = text_rect.width + 30
@@ -406,14 +633,77 @@ class AIVsAIGUI:
 
             text_rect.center = (WINDOW_WIDTH // 2, box_y + box_height // 2)
             self.screen.blit(text_surface, text_rect)
-            self.action_effect_timer -= 1
+            return bg_rect
+        return None
 
     # -------------------- Core game loop helpers --------------------
-    def step_ai(self):
+    # -------------------- AI worker --------------------
+    def _ai_worker(self):
+        """Background loop: turn (token, player, state, valid) requests into (token, player, action)."""
+        while True:
+            request = self._move_requests.get()
+            if request is None:
+                return
+            token, cp, state, valid = request
+            with self._agent_lock:
+                action_index = self.agents[cp].choose_action(state, valid)
+            self._move_queue.put((token, cp, action_index))
+            # Wake the main loop up (it sleeps in pygame.event.wait)
+            try:
+                pygame.event.post(pygame.event.Event(AI_DECIDED_EVENT))
+            except pygame.error:
+                # Display already shut down
+                return
+
+    def start_ai_worker(self):
+        """Start the decision thread (once)."""
+        if self._ai_thread is None or not self._ai_thread.is_alive():
+            self._ai_thread = threading.Thread(target=self._ai_worker, daemon=True)
+            self._ai_thread.start()
+
+    def stop_ai_worker(self):
+        """Ask the decision thread to exit once it finished its current request."""
+        if self._ai_thread is not None:
+            self._move_requests.put(None)
+            self._ai_thread = None
+
+    def request_ai_move(self):
+        """
+        Hand the current player's decision to the worker thread.
+        Draws need no agent decision and are applied right away.
+        """
+        cp = self.game.current_player
+        valid = self.game.get_valid_cards(cp)
+        if not valid:
+            self.step_ai()
+            return
+        state = self.game.get_state_for_ai(cp)
+        # The worker gets a snapshot: penalties keep appending to the live hand meanwhile
+        state['hand'] = list(state['hand'])
+        self._move_token += 1
+        self._awaiting_move = True
+        self._move_requests.put((self._move_token, cp, state, list(valid)))
+
+    def apply_ready_moves(self):
+        """Drain finished worker decisions and apply the one still matching the game."""
+        while True:
+            try:
+                token, cp, action_index = self._move_queue.get_nowait()
+            except queue.Empty:
+                return
+            if not self._awaiting_move or token != self._move_token:
+                # Stale answer (e.g. the game was restarted meanwhile)
+                continue
+            self._awaiting_move = False
+            if cp == self.game.current_player and not self.game.game_over:
+                self.step_ai(action_index)
+
+    def step_ai(self, action_index=None):
         """
         Execute a single AI move:
           - Ask game for valid cards for current player
-          - Ask corresponding agent to choose an action
+          - Ask corresponding agent to choose an action (unless the worker
+            thread already chose `action_index`)
           - Play card or draw if needed
           - Handle wild color selection via the game API
           - Enforce GUI-level UNO rule: track when a player reaches 1 card,
@@ -421,14 +711,19 @@ class AIVsAIGUI:
         """
         cp = self.game.current_player
         player_name = f"P{cp+1} ({self.agent_names[cp]})"
+        # Every move changes hands, the discard pile or the turn indicator
+        self._dirty = True
 
         # Acquire state & valid actions from game engine
         state = self.game.get_state_for_ai(cp)
         valid = self.game.get_valid_cards(cp)
 
         if valid:
-            # Agents choose index (index refers to position in player's hand)
-            action_index = self.agents[cp].choose_action(state, valid)
+            # Agents choose index (index refers to position in player's hand).
+            # A worker answer that is no longer playable is decided again here.
+            if action_index is None or action_index not in valid:
+                with self._agent_lock:
+                    action_index = self.agents[cp].choose_action(state, valid)
             card = self.game.hands[cp][action_index]
 
             if card.color == Color.WILD:
@@ -452,7 +747,7 @@ class AIVsAIGUI:
                     self.show_action_effect(f"🔄 {player_name} played Reverse!")
         else:
             # No valid play -> draw. If pending_draw exists, draw multiple.
-            pending = getattr(self.game, "pending_draw", 0)
+            pending = self.game.pending_draw
             if pending > 0:
                 self.game.draw_multiple_cards(cp, pending)
                 self.show_notification(f"{player_name} drew {pending} cards!", RED, 90)
@@ -465,9 +760,9 @@ class AIVsAIGUI:
         # ---- UNO GUI-level enforcement ----
         # If player now has exactly 1 card, record the time and let AI possibly auto-call UNO.
         new_count = len(self.game.hands[cp])
-        now_ms = pygame.time.get_ticks()
+        now_ms = self.now_ms
 
-        if new_count == 1 and self.uno_time[cp] is None:
+        if new_count == 1 and self.uno_time[cp] < 0:
             # They just reached 1 card: start tracking
             self.uno_time[cp] = now_ms
             self.uno_called[cp] = False
@@ -479,33 +774,50 @@ class AIVsAIGUI:
             else:
                 # AI "forgets" to call UNO — will be catchable by others for a window
                 self.show_notification(f"{player_name} forgot to say UNO!", RED, 90)
-
-        # Check for UNO catch windows: if player didn't call UNO and the window elapsed,
-        # apply penalty (draw 2). For simplicity, we auto-catch and penalize.
-        for p in range(self.num_players):
-            if self.uno_time[p] is not None and not self.uno_called[p]:
-                elapsed = now_ms - self.uno_time[p]
-                if elapsed >= self.uno_catch_window_ms:
-                    # The next player is the one that "catches" them in this simplified rule.
-                    caught_by = (p + 1) % self.num_players
-                    # Apply penalty via game engine method (draw_multiple_cards)
-                    self.game.draw_multiple_cards(p, 2)
-                    self.show_notification(f"P{caught_by+1} caught P{p+1} — P{p+1} draws 2!", RED, self.uno_penalty_message_duration)
-                    # Reset UNO tracking for that player
-                    self.uno_time[p] = None
-                    self.uno_called[p] = False
+                self._pending_uno.append((now_ms + self.uno_catch_window_ms, cp))
 
         # If someone has won (game.game_over should be set by engine), do NOT switch turn.
         if not self.game.game_over:
             # Let the game engine decide next player (switch_turn should honor Skip/Reverse logic)
             self.game.switch_turn()
 
+    def check_uno_penalties(self, now_ms):
+        """
+        Penalize missed UNO calls whose catch window elapsed (draw 2).
+        For simplicity, the next player always catches them. All windows have the
+        same length, so only the oldest pending entry needs to be looked at.
+        """
+        while self._pending_uno and now_ms >= self._pending_uno[0][0]:
+            _, p = self._pending_uno.popleft()
+            if self.game.game_over or self.uno_called[p] or self.uno_time[p] < 0:
+                continue
+            # The next player is the one that "catches" them in this simplified rule.
+            caught_by = (p + 1) % self.num_players
+            # Apply penalty via game engine method (draw_multiple_cards)
+            self.game.draw_multiple_cards(p, 2)
+            self.show_notification(f"P{caught_by+1} caught P{p+1} — P{p+1} draws 2!", RED, self.uno_penalty_message_duration)
+            # Reset UNO tracking for that player
+            self.uno_time[p] = -1
+            self.uno_called[p] = False
+
+    def set_move_timer(self, on):
+        """
+        Start (every move_delay ms) or stop the MOVE_EVENT timer. It is stopped
+        while a finished game is on screen so the idle loop isn't woken for nothing.
+        """
+        self._move_timer_on = on
+        pygame.time.set_timer(MOVE_EVENT, self.move_delay if on else 0)
+
     def toggle_speed(self):
         """Cycle through available speeds and recompute move_delay."""
         current_idx = self.speeds.index(self.game_speed) if self.game_speed in self.speeds else 0
         self.game_speed = self.speeds[(current_idx + 1) % len(self.speeds)]
         # Lower bound to avoid zero or negative delays
         self.move_delay = max(10, int(self.base_delay_unit_ms / self.game_speed))
+        if self._move_timer_on:
+            self.set_move_timer(True)
+        # The SPEED button label is part of the static background
+        self._build_static_bg()
         self.show_notification(f"Speed: {self.game_speed}x", CYAN, 60)
 
     def handle_back_to_start(self):
@@ -516,6 +828,7 @@ class AIVsAIGUI:
         avoids running multiple Pygame windows/processes.
         """
         # First quit current pygame subsystems to avoid conflicts
+        self.stop_ai_worker()
         pygame.quit()
 
         # Import and run the StartMenu loop — this will create a fresh pygame window.
@@ -532,56 +845,87 @@ class AIVsAIGUI:
         # If StartMenu().run() ever returns, exit to be safe
         sys.exit(0)
 
-    def run_simulation_batches(self, game_counts=[5000,10000,15000,20000]):
+    def _simulate_game(self, num_agents):
+        """Play one full AI vs AI game off-screen and return the winner's index."""
+        game = MultiplayerGame(num_agents)
+        while not game.game_over:
+            cp = game.current_player
+            state = game.get_state_for_ai(cp)
+            valid = game.get_valid_cards(cp)
+
+            if valid:
+                action_index = self.agents[cp].choose_action(state, valid)
+                card = game.hands[cp][action_index]
+
+                if card.color == Color.WILD:
+                    chosen_color = game.choose_color_for_wild(cp)
+                    game.play_card(cp, action_index, chosen_color)
+                else:
+                    game.play_card(cp, action_index)
+            else:
+                pending = game.pending_draw
+                if pending > 0:
+                    game.draw_multiple_cards(cp, pending)
+                    game.pending_draw = 0
+                else:
+                    game.draw_card(cp)
+
+            if not game.game_over:
+                game.switch_turn()
+        return game.winner
+
+    def run_simulation_batches(self, game_counts=[5000,10000,15000,20000], cumulative=False):
         """
         Run AI vs AI simulations for different game counts.
-        Returns: list of dicts [{0: wins, 1: wins}, ...]
+        By default every count is an independent batch of that many games.
+        cumulative=True instead plays one run of max(game_counts) games and
+        records the running win totals as each count is reached: far fewer games,
+        but the points are nested prefixes of one sample (correlated, no
+        batch-to-batch variance). Plot those with plot_results(..., cumulative=True).
+        Returns: list of dicts [{0: wins, 1: wins}, ...], in game_counts order
         """
         num_agents = self.num_players
-        all_results = []
         self.game_counts=game_counts
+        if cumulative:
+            return self._run_cumulative_simulation(game_counts)
+
+        all_results = []
         for games in game_counts:
             wins = {i: 0 for i in range(num_agents)}
             print(f"\nRunning simulation for {games} games...")
 
             for _ in range(games):
-                game = MultiplayerGame(num_agents)
-                while not game.game_over:
-                    cp = game.current_player
-                    state = game.get_state_for_ai(cp)
-                    valid = game.get_valid_cards(cp)
-
-                    if valid:
-                        action_index = self.agents[cp].choose_action(state, valid)
-                        card = game.hands[cp][action_index]
-
-                        if card.color == Color.WILD:
-                            chosen_color = game.choose_color_for_wild(cp)
-                            game.play_card(cp, action_index, chosen_color)
-                        else:
-                            game.play_card(cp, action_index)
-                    else:
-                        pending = getattr(game, "pending_draw", 0)
-                        if pending > 0:
-                            game.draw_multiple_cards(cp, pending)
-                            game.pending_draw = 0
-                        else:
-                            game.draw_card(cp)
-
-                    if not game.game_over:
-                        game.switch_turn()
-
-                winner = getattr(game, "winner", 0)
-                wins[winner] += 1
+                wins[self._simulate_game(num_agents)] += 1
 
             all_results.append(wins)
             print("Batch result:", wins)
 
         print("\nAll Results:", all_results)
         return all_results
-    def plot_results(self, results, agent_names=["Q-Learning", "Random","heuristic"]):
+
+    def _run_cumulative_simulation(self, game_counts):
+        """run_simulation_batches(cumulative=True): one run, checkpointed totals."""
+        num_agents = self.num_players
+        checkpoints = set(game_counts)
+        total = max(game_counts)
+        wins = {i: 0 for i in range(num_agents)}
+        results_at = {0: dict(wins)}
+        print(f"\nRunning simulation for {total} games...")
+
+        for played in range(1, total + 1):
+            wins[self._simulate_game(num_agents)] += 1
+            if played in checkpoints:
+                results_at[played] = dict(wins)
+                print(f"Cumulative wins after {played} games:", results_at[played])
+
+        all_results = [results_at[games] for games in game_counts]
+        print("\nAll Results:", all_results)
+        return all_results
+    def plot_results(self, results, agent_names=["Q-Learning", "Random","heuristic"], cumulative=False):
         """
         Plots results: [{0: wins, 1: wins}, ...]
+        cumulative=True plots run_simulation_batches(cumulative=True) results as the
+        cumulative win rate after N games.
         """
         num_agents = len(agent_names)
         num_batches = len(results)
@@ -593,6 +937,11 @@ class AIVsAIGUI:
             for i, wins in batch.items():
                 agent_wins[i].append(wins)
 
+        if cumulative:
+            # cumulative wins -> cumulative win rate after x[j] games
+            for i in agent_wins:
+                agent_wins[i] = [wins / games for wins, games in zip(agent_wins[i], x)]
+
         plt.figure(figsize=(10, 6))
 
         for i in agent_wins:
@@ -604,30 +953,170 @@ class AIVsAIGUI:
                 label=agent_names[i]
             )
 
-        plt.title("Win Progression Over Increasing Game Batches", fontsize=14)
-        plt.xlabel("Episodes", fontsize=12)
-        plt.ylabel("Wins", fontsize=12)
+        if cumulative:
+            plt.title("Cumulative Win Rate After N Games (one run)", fontsize=14)
+            plt.xlabel("Games played (N)", fontsize=12)
+            plt.ylabel("Cumulative win rate", fontsize=12)
+        else:
+            plt.title("Win Progression Over Increasing Game Batches", fontsize=14)
+            plt.xlabel("Episodes", fontsize=12)
+            plt.ylabel("Wins", fontsize=12)
         plt.grid(True, alpha=0.3)
         plt.legend()
         plt.tight_layout()
         plt.show()
     def plotting(self):
-        results = self.run_simulation_batches()
+        # The simulation shares the agents with the worker thread
+        with self._agent_lock:
+            results = self.run_simulation_batches()
         self.plot_results(results)
 
+    def draw(self):
+        """
+        Redraw the scene onto the screen Surface (does not flip).
+        Only the areas drawn in the previous frame are restored from the static
+        background. Returns the list of rects that changed and need
+        pygame.display.update(), or None when the whole window must be flipped.
+        """
+        # Hot attributes as locals for the rest of the frame
+        game = self.game
+        screen = self.screen
+        text = self._text
+        names = self.agent_names
+        hands = game.hands
+        players = range(self.num_players)
+
+        # Table, buttons, deck back and box frames: the whole background on a full
+        # redraw, otherwise only underneath what the previous frame drew
+        static_bg = self._static_bg
+        full = self._full_redraw
+        previous = self._dirty_rects
+        if full:
+            screen.blit(static_bg, (0, 0))
+        else:
+            screen.blits([(static_bg, r, r) for r in previous], doreturn=False)
+        rects = []
+
+        # Draw discard/deck area & info box
+        rects.extend(self.draw_discard_pile())
+
+        # Draw stats box
+        rects.append(self.draw_stats())
+
+        # Draw all player hands using corner-based layout, every card in one blits call
+        card_blits = []
+        for p in players:
+            hand_blits = self.get_hand_blits(p, face_up=True)
+            if hand_blits is not None:
+                card_blits.extend(hand_blits[0])
+                rects.append(hand_blits[1].copy())
+        screen.blits(card_blits, doreturn=False)
+
+        # Draw labels for each player (one blits call for all of them)
+        small_font = self.small_font
+        count_surfs = self._label_count_surfs
+        suffix_surf = self._label_suffix_surf
+        labels = []
+        for p in players:
+            start_x, y, spacing = self.compute_hand_layout(p)
+            prefix_surf = self._label_prefix_surfs[p]
+            count_surf = count_surfs[len(hands[p])]
+
+            # Position labels above or below cards
+            if p in (0, 1):  # top row - label above
+                label_y = y - 22
+            else:  # bottom row - label below
+                label_y = y + CARD_HEIGHT + 8
+
+            count_x = start_x + prefix_surf.get_width()
+            labels.append((prefix_surf, (start_x, label_y)))
+            labels.append((count_surf, (count_x, label_y)))
+            labels.append((suffix_surf, (count_x + count_surf.get_width(), label_y)))
+        rects.extend(screen.blits(labels))
+
+        # Turn indicator (center top)
+        current = game.current_player
+        turn_surface = text(f"P{current+1}'s TURN ({names[current]})", self.font, YELLOW)
+        # Slightly lower so it doesn't overlap top buttons
+        turn_rect = turn_surface.get_rect(center=(WINDOW_WIDTH // 2, 95))
+        rects.append(screen.blit(turn_surface, turn_rect))
+
+        # Notifications & action effects
+        rects.append(self.draw_notification())
+        rects.append(self.draw_action_effect())
+
+        # Game over overlay (if engine sets game_over True and winner)
+        if game.game_over:
+            screen.blit(self._game_over_overlay, (0, 0))
+
+            winner_idx = game.winner
+            winner_surf = text(f" P{winner_idx + 1} ({names[winner_idx]}) WINS!", self.font, (0, 255, 0))
+            winner_rect = winner_surf.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
+            screen.blit(winner_surf, winner_rect)
+
+            restart_text = text("Click NEW GAME to play again", small_font, WHITE)
+            restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
+            screen.blit(restart_text, restart_rect)
+            # The overlay covers everything; the frame after it starts from scratch
+            self._full_redraw = True
+            return None
+
+        self._dirty_rects = [r for r in rects if r is not None]
+        self._full_redraw = False
+        if full:
+            return None
+        # Old positions must be refreshed too (things move or disappear)
+        return self._dirty_rects + previous
+
+    def next_wakeup_ms(self):
+        """
+        How long run() may sleep before a notification or UNO catch window expires
+        (0 = nothing pending, sleep until the next event).
+        """
+        deadlines = []
+        if self.notification:
+            deadlines.append(self.notification_expires)
+        if self.action_effect:
+            deadlines.append(self.action_effect_expires)
+        if self._pending_uno:
+            deadlines.append(self._pending_uno[0][0])
+        if not deadlines:
+            return 0
+        return max(1, min(deadlines) - monotonic_ms())
+
     def run(self):
-        """Main Pygame loop for AI vs AI mode."""
+        """
+        Main Pygame loop for AI vs AI mode.
+        Event driven: the loop sleeps in pygame.event.wait() until input, the move
+        timer (MOVE_EVENT), a decision from the worker (AI_DECIDED_EVENT) or the
+        next message deadline, so idle time between moves costs no CPU.
+        """
+        self.start_ai_worker()
+        self.set_move_timer(True)
         running = True
         while running:
-            self.clock.tick(FPS)
+            first = pygame.event.wait(self.next_wakeup_ms())
+            # One clock read per wake-up; everything below uses this timestamp
+            now = self.now_ms = monotonic_ms()
 
             # ---- Event handling ----
-            for event in pygame.event.get():
+            for event in [first] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
 
+                # Time for the next AI move (skipped while the worker is still deciding)
+                if event.type == MOVE_EVENT:
+                    if not self._awaiting_move and not self.game.game_over:
+                        self.request_ai_move()
+                        self.last_move_time = now
+
+                # Window uncovered/restored: the old frame has to be repainted
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._dirty = True
+                    self._full_redraw = True
+
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = event.pos
 
                     # BACK -> return to start menu (import & run StartMenu)
                     if self.back_button_rect.collidepoint((mx, my)):
@@ -638,12 +1127,19 @@ class AIVsAIGUI:
                     # Inside the MOUSEBUTTONDOWN event handling:
                     if self.plot_button_rect.collidepoint((mx, my)):
                         self.plotting()
+                        # The simulation blocked the loop; repaint afterwards
+                        self._dirty = True
+                        self._full_redraw = True
                         continue
                     # NEW GAME -> reset engine & UNO GUI trackers
                     if self.new_game_button_rect.collidepoint((mx, my)):
                         self.game.reset()
-                        self.uno_called = {i: False for i in range(self.num_players)}
-                        self.uno_time = {i: None for i in range(self.num_players)}
+                        # Drop any decision still being made for the old game
+                        self._awaiting_move = False
+                        self.uno_called = [False] * self.num_players
+                        self.uno_time = [-1] * self.num_players
+                        self._pending_uno.clear()
+                        self.set_move_timer(True)
                         self.show_notification("New game started!", GREEN, 60)
                         continue
 
@@ -657,81 +1153,29 @@ class AIVsAIGUI:
                         self.toggle_speed()
                         continue
 
-            # ---- AI move timing ----
-            now = pygame.time.get_ticks()
-            if now - self.last_move_time >= self.move_delay and not self.game.game_over:
-                self.step_ai()
-                self.last_move_time = now
-
-            # ---- Drawing ----
-            self.screen.fill(GREEN)
-
-            # Draw discard/deck area & info box
-            self.draw_discard_pile()
-            # After drawing other buttons:
-            self.draw_button(self.plot_button_rect, "PLOT GRAPHS", ORANGE)
-
-            # Top bar buttons (consistent alignment)
-            self.draw_button(self.back_button_rect, "BACK", PURPLE)
-            self.draw_button(self.end_game_button_rect, "END GAME", RED)
-            self.draw_button(self.new_game_button_rect, "NEW GAME", DARK_GREEN)
-            self.draw_button(self.speed_button_rect, f"SPEED\n{self.game_speed}x", CYAN)
-
-            # Draw stats box
-            self.draw_stats()
-
-            # Draw all player hands using corner-based layout
-            for p in range(self.num_players):
-                self.draw_player_hand(p, face_up=True)
-
-            # Draw labels for each player
-            for p in range(self.num_players):
-                start_x, y, spacing = self.compute_hand_layout(p)
-                hand_size = len(self.game.hands[p])
-                
-                label_text = f"P{p+1} ({self.agent_names[p]}): {hand_size} cards"
-                label_surf = self.small_font.render(label_text, True, WHITE)
-                
-                # Position labels above or below cards
-                if p in (0, 1):  # top row - label above
-                    label_y = y - 22
-                else:  # bottom row - label below
-                    label_y = y + CARD_HEIGHT + 8
-                
-                self.screen.blit(label_surf, (start_x, label_y))
-
-            # Turn indicator (center top)
-            current = getattr(self.game, "current_player", 0)
-            turn_text = f"P{current+1}'s TURN ({self.agent_names[current]})"
-            turn_surface = self.font.render(turn_text, True, YELLOW)
-            # Slightly lower so it doesn't overlap top buttons
-            turn_rect = turn_surface.get_rect(center=(WINDOW_WIDTH // 2, 95))
-            self.screen.blit(turn_surface, turn_rect)
-
-            # Notifications & action effects
-            self.draw_notification()
-            self.draw_action_effect()
-
-            # Game over overlay (if engine sets game_over True and winner)
-            if getattr(self.game, "game_over", False):
-                overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-                overlay.set_alpha(200)
-                overlay.fill(BLACK)
-                self.screen.blit(overlay, (0, 0))
-
-                winner_idx = getattr(self.game, "winner", 0)
-                winner_text = f" P{winner_idx + 1} ({self.agent_names[winner_idx]}) WINS!"
-                text = self.font.render(winner_text, True, (0, 255, 0))
-                text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-                self.screen.blit(text, text_rect)
-
-                restart_text = self.small_font.render("Click NEW GAME to play again", True, WHITE)
-                restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
-                self.screen.blit(restart_text, restart_rect)
-
-            pygame.display.flip()
+            # Apply moves the worker thread has decided on
+            self.apply_ready_moves()
+            if self.game.game_over and self._move_timer_on:
+                self.set_move_timer(False)
+            # Missed UNO calls whose catch window is over
+            self.check_uno_penalties(now)
+
+            # Remove notifications whose time is up
+            self.expire_messages(now)
+
+            # ---- Drawing (only when something visible changed) ----
+            if self._dirty:
+                changed = self.draw()
+                if (changed is None or sum(r.width * r.height for r in changed)
+                        > FULL_FLIP_AREA * WINDOW_WIDTH * WINDOW_HEIGHT):
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(changed)
+                self._dirty = False
 
         # Clean up Pygame and exit when loop ends
+        self.set_move_timer(False)
+        self.stop_ai_worker()
         pygame.quit()
         sys.exit()
 
@@ -2,14 +2,21 @@
 
 import pygame
 import sys
-from uno_game import UnoGame, Color, CardType
-from ql_agent import QLearningAgent, RandomAgent, HeuristicAgent, train_agent, train_with_curriculum
+import threading
+from uno_game import UnoGame, Color, CardType, COLOR_RGB
+from ql_agent import QLearningAgent, RandomAgent, HeuristicAgent, train_agent, train_with_curriculum, MODEL_FILE
 
 pygame.init()
 
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
 FPS = 60
+# Training runs in a background thread; the window only shows a progress
+# screen meanwhile, so it redraws slowly and leaves the CPU to the trainer
+TRAINING_FPS = 5
+
+# Posted by the training thread when it has finished and saved the model
+TRAINING_DONE_EVENT = pygame.USEREVENT + 1
 
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -26,6 +33,24 @@ CYAN = (0, 255, 255)
 CARD_WIDTH = 80
 CARD_HEIGHT = 120
 CARD_RADIUS = 10
+# Color key for the corners outside a card's rounded rect (no card pixel uses it)
+CARD_KEY = (255, 0, 255)
+
+# Hand layout: horizontal distance between cards and the human player's row
+HAND_SPACING = 90
+PLAYER_HAND_Y = WINDOW_HEIGHT - 180
+
+# Above this share of the window, one full flip is cheaper than a list of dirty rects
+FULL_FLIP_AREA = 0.5
+
+# Center label for non-number cards
+CARD_TYPE_LABELS = {
+    CardType.SKIP: "Skip",
+    CardType.REVERSE: "Rev",
+    CardType.DRAW_TWO: "+2",
+    CardType.WILD: "Wild",
+    CardType.WILD_DRAW_FOUR: "+4"
+}
 
 class UnoGUI:
     """CORRECTED GUI with action card effects"""
@@ -33,6 +58,11 @@ class UnoGUI:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("SMART UNO - RL AGENT")
+        # Only queue the events this screen handles (mouse motion, keys, etc. are dropped by SDL)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED,
+                                  TRAINING_DONE_EVENT])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.small_font = pygame.font.Font(None, 24)
@@ -40,12 +70,19 @@ class UnoGUI:
         
         self.game = UnoGame()
         self.agent = QLearningAgent(alpha=0.15, gamma=0.95, epsilon=0.25, name="Q-Agent")
-        self.agent.load_model()
+        self.agent.load_model(MODEL_FILE)
         
         self.selected_card = None
         self.hovered_card = None
         self.choosing_color = False
         self.training_mode = False
+        self._training_thread = None
+        self._training_started = 0
+        self._quit_after_training = False
+        self._training_label = ""
+        # agent.games_played when training started, and the games it will add
+        self._training_games_base = 0
+        self._training_games_total = 0
         self.show_q_values = False
         self.ai_delay = 0
         
@@ -63,6 +100,33 @@ class UnoGUI:
         # Action effect display
         self.action_effect = ""
         self.action_effect_timer = 0
+
+        # Render caches: card Surfaces keyed by (card_type, number, color), with
+        # all card backs sharing the None entry; glow/highlight/deck built on first use
+        self._card_surface_cache = {}
+        self._glow_surf = None
+        self._highlight_surf = None
+        self._deck_back_surf = None
+        # Rendered text Surfaces keyed by (text, font, color), see _text()
+        self._text_cache = {}
+        # Full-window black dimming overlays: color choice (alpha 128) and game over (200)
+        self._dim_overlay_128 = self._dim_overlay(128)
+        self._dim_overlay_200 = self._dim_overlay(200)
+
+        # Set when something changed since the last frame, see is_idle()
+        self._needs_redraw = True
+
+        # Dirty rectangles: areas drawn this frame and last frame; run() pushes only
+        # those with display.update() unless a full flip is needed
+        self._dirty_rects = []
+        self._prev_dirty_rects = []
+        self._full_flip = True
+
+        # Card rects per (hand size, row y), see get_hand_rects()
+        self._hand_rects = {}
+        # get_player_valid_cards() result and the key it was computed for
+        self._player_valid = []
+        self._player_valid_key = None
         
         
         # Buttons
@@ -77,6 +141,18 @@ class UnoGUI:
         # Stats (moved down)
         self.stats_rect = pygame.Rect(WINDOW_WIDTH - 260, 300, 240, 200)
 
+        # Wild color picker boxes, (rect, Color) pairs; fixed for the window size
+        self.color_choice_rects = self._compute_color_choice_rects()
+        self._color_choice_boxes = [rect for rect, _ in self.color_choice_rects]
+        # Title, boxes and labels of the picker, see draw_color_choice()
+        self._color_choice_panel = None
+
+        # Table, buttons, deck and box frames, see _build_static_bg();
+        # set _bg_dirty when one of the button labels changes
+        self._static_bg = None
+        self._bg_dirty = False
+        self._build_static_bg()
+
         # Deck rect (necessary!)
         self.deck_rect = pygame.Rect(
             WINDOW_WIDTH // 2 - CARD_WIDTH - 120,
@@ -105,105 +181,179 @@ class UnoGUI:
         # Destroy the Tkinter window and exit the program
         self.root.destroy()
 
-    def draw_card(self, card, x, y, face_up=True, highlight=False, glow=False, q_value=None):
-        if glow:
-            glow_rect = pygame.Rect(x - 5, y - 5, CARD_WIDTH + 10, CARD_HEIGHT + 10)
-            pygame.draw.rect(self.screen, YELLOW, glow_rect, border_radius=CARD_RADIUS + 2)
-        
+    def _build_card_surface(self, card, face_up):
+        """Render one card face (or the card back) onto an offscreen Surface, once."""
+        surf = pygame.Surface((CARD_WIDTH, CARD_HEIGHT)).convert()
+        surf.fill(CARD_KEY)
         color = WHITE if face_up else GRAY
-        if highlight:
-            pygame.draw.rect(self.screen, ORANGE, 
-                           (x - 3, y - 3, CARD_WIDTH + 6, CARD_HEIGHT + 6), 
-                           border_radius=CARD_RADIUS)
         
-        pygame.draw.rect(self.screen, color, (x, y, CARD_WIDTH, CARD_HEIGHT), 
+        pygame.draw.rect(surf, color, (0, 0, CARD_WIDTH, CARD_HEIGHT), 
                         border_radius=CARD_RADIUS)
-        pygame.draw.rect(self.screen, BLACK, (x, y, CARD_WIDTH, CARD_HEIGHT), 
+        pygame.draw.rect(surf, BLACK, (0, 0, CARD_WIDTH, CARD_HEIGHT), 
                         width=2, border_radius=CARD_RADIUS)
         
         if face_up:
             card_color = card.get_color_rgb()
-            pygame.draw.rect(self.screen, card_color, 
-                           (x + 10, y + 10, CARD_WIDTH - 20, CARD_HEIGHT - 20),
+            pygame.draw.rect(surf, card_color, 
+                           (10, 10, CARD_WIDTH - 20, CARD_HEIGHT - 20),
                            border_radius=5)
             
             if card.card_type == CardType.NUMBER:
                 text = str(card.number)
             else:
-                type_names = {
-                    CardType.SKIP: "Skip",
-                    CardType.REVERSE: "Rev",
-                    CardType.DRAW_TWO: "+2",
-                    CardType.WILD: "Wild",
-                    CardType.WILD_DRAW_FOUR: "+4"
-                }
-                text = type_names.get(card.card_type, "?")
+                text = CARD_TYPE_LABELS.get(card.card_type, "?")
             
             text_surface = self.font.render(text, True, WHITE)
-            text_rect = text_surface.get_rect(center=(x + CARD_WIDTH // 2, y + CARD_HEIGHT // 2))
-            self.screen.blit(text_surface, text_rect)
-            
+            text_rect = text_surface.get_rect(center=(CARD_WIDTH // 2, CARD_HEIGHT // 2))
+            surf.blit(text_surface, text_rect)
+        
+        surf.set_colorkey(CARD_KEY, pygame.RLEACCEL)
+        return surf
+    
+    def get_card_surface(self, card, face_up=True):
+        """Return the cached Surface for `card`, building it on first use."""
+        key = (card.card_type, card.number, card.color) if face_up else None
+        surf = self._card_surface_cache.get(key)
+        if surf is None:
+            surf = self._card_surface_cache[key] = self._build_card_surface(card, face_up)
+        return surf
+    
+    def _text(self, text, font, color):
+        """Return `text` rendered with `font` in `color`, rasterizing each combination once."""
+        key = (text, font, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Counters such as "Turns: N" keep producing new strings; start over
+            # instead of growing for the whole session
+            if len(self._text_cache) >= 512:
+                self._text_cache.clear()
+            surf = self._text_cache[key] = font.render(text, True, color).convert_alpha()
+        return surf
+    
+    def _dim_overlay(self, alpha):
+        """A window-sized black Surface blended at `alpha`, built once and reused."""
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        overlay.fill(BLACK)
+        overlay.set_alpha(alpha)
+        return overlay
+    
+    def _outline_surface(self, color, margin, radius):
+        """A rounded rect `margin` px larger than a card on each side (glow/highlight)."""
+        size = (CARD_WIDTH + 2 * margin, CARD_HEIGHT + 2 * margin)
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(surf, color, (0, 0) + size, border_radius=radius)
+        return surf.convert_alpha()
+    
+    def draw_card(self, card, x, y, face_up=True, highlight=False, glow=False, q_value=None):
+        # glow margin included
+        self._dirty_rects.append(pygame.Rect(x - 5, y - 5, CARD_WIDTH + 10, CARD_HEIGHT + 10))
+        if glow:
+            if self._glow_surf is None:
+                self._glow_surf = self._outline_surface(YELLOW, 5, CARD_RADIUS + 2)
+            self.screen.blit(self._glow_surf, (x - 5, y - 5))
+        
+        if highlight:
+            if self._highlight_surf is None:
+                self._highlight_surf = self._outline_surface(ORANGE, 3, CARD_RADIUS)
+            self.screen.blit(self._highlight_surf, (x - 3, y - 3))
+        
+        self.screen.blit(self.get_card_surface(card, face_up), (x, y))
+        
+        if face_up:
             if q_value is not None and self.show_q_values:
-                q_text = self.tiny_font.render(f"Q:{q_value:.2f}", True, BLACK)
+                q_text = self._text(f"Q:{q_value:.2f}", self.tiny_font, BLACK)
                 q_bg = pygame.Rect(x + 2, y + 2, 70, 18)
                 pygame.draw.rect(self.screen, YELLOW, q_bg, border_radius=3)
                 self.screen.blit(q_text, (x + 4, y + 4))
     
     def draw_player_hand(self, hand, y_pos, face_up=True, check_valid=False, show_q=False, state=None):
-        spacing = 90
+        spacing = HAND_SPACING
         total_width = len(hand) * spacing
         start_x = (WINDOW_WIDTH - total_width) // 2
         
-        card_rects = []
-        valid_cards = self.game.get_valid_cards(hand) if check_valid else []
+        if not check_valid:
+            valid_cards = []
+        elif hand is self.game.player_hand:
+            valid_cards = self.get_player_valid_cards()
+        else:
+            valid_cards = self.game.get_valid_cards(hand)
         
         q_values = {}
         if show_q and state and face_up:
             q_values = self.agent.get_action_confidences(state, valid_cards)
         
-        for i, card in enumerate(hand):
-            x = start_x + i * spacing
-            highlight = (self.selected_card == i and face_up)
-            glow = (i in valid_cards and face_up)
-            q_val = q_values.get(i, None) if show_q else None
-            
-            self.draw_card(card, x, y_pos, face_up, highlight, glow, q_val)
-            card_rects.append(pygame.Rect(x, y_pos, CARD_WIDTH, CARD_HEIGHT))
+        if self._glow_surf is None:
+            self._glow_surf = self._outline_surface(YELLOW, 5, CARD_RADIUS + 2)
+        if self._highlight_surf is None:
+            self._highlight_surf = self._outline_surface(ORANGE, 3, CARD_RADIUS)
+        
+        # Same layering as draw_card (glow, highlight, card), but the whole hand
+        # goes to pygame in one blits() call. Cards are 10px apart, so the
+        # outlines never overlap a neighbour and the order is only per card.
+        blit_seq = []
+        get_surface = self.get_card_surface
+        glow = set(valid_cards) if face_up else ()
+        selected = self.selected_card if face_up else None
+        # x positions come from a range() rather than start_x + i * spacing per card
+        xs = range(start_x, start_x + total_width, spacing)
+        for i, (x, card) in enumerate(zip(xs, hand)):
+            if i in glow:
+                blit_seq.append((self._glow_surf, (x - 5, y_pos - 5)))
+            if i == selected:
+                blit_seq.append((self._highlight_surf, (x - 3, y_pos - 3)))
+            blit_seq.append((get_surface(card, face_up), (x, y_pos)))
+        card_rects = self.get_hand_rects(len(hand), y_pos)
+        self.screen.blits(blit_seq, doreturn=False)
+        if hand:
+            # glow margin included
+            self._dirty_rects.append(pygame.Rect(start_x - 5, y_pos - 5, total_width, CARD_HEIGHT + 10))
+        
+        if show_q and face_up and self.show_q_values:
+            for i, q_val in q_values.items():
+                x = start_x + i * spacing
+                q_text = self._text(f"Q:{q_val:.2f}", self.tiny_font, BLACK)
+                q_bg = pygame.Rect(x + 2, y_pos + 2, 70, 18)
+                pygame.draw.rect(self.screen, YELLOW, q_bg, border_radius=3)
+                self.screen.blit(q_text, (x + 4, y_pos + 4))
         
         return card_rects, valid_cards
     
-    def draw_discard_pile(self):
-        top_card = self.game.get_top_card()
-        x = WINDOW_WIDTH // 2 - CARD_WIDTH - 20
-        y = WINDOW_HEIGHT // 2 - CARD_HEIGHT // 2
-        
+    def _build_deck_back_surf(self):
+        """The face-down deck with its UNO circle, as one card-sized Surface."""
+        surf = pygame.Surface((CARD_WIDTH, CARD_HEIGHT)).convert()
+        surf.fill(CARD_KEY)
         deck_color = (50, 50, 50)
-        pygame.draw.rect(self.screen, deck_color, 
-                        (x - 100, y, CARD_WIDTH, CARD_HEIGHT), 
+        pygame.draw.rect(surf, deck_color, 
+                        (0, 0, CARD_WIDTH, CARD_HEIGHT), 
                         border_radius=CARD_RADIUS)
-        pygame.draw.rect(self.screen, BLACK, 
-                        (x - 100, y, CARD_WIDTH, CARD_HEIGHT), 
+        pygame.draw.rect(surf, BLACK, 
+                        (0, 0, CARD_WIDTH, CARD_HEIGHT), 
                         width=3, border_radius=CARD_RADIUS)
         
-        center_x = x - 100 + CARD_WIDTH // 2
-        center_y = y + CARD_HEIGHT // 2
-        pygame.draw.circle(self.screen, (220, 20, 60), (center_x, center_y), 28)
-        pygame.draw.circle(self.screen, BLACK, (center_x, center_y), 28, 2)
+        center = (CARD_WIDTH // 2, CARD_HEIGHT // 2)
+        pygame.draw.circle(surf, (220, 20, 60), center, 28)
+        pygame.draw.circle(surf, BLACK, center, 28, 2)
         uno_text = self.small_font.render("UNO", True, WHITE)
-        uno_rect = uno_text.get_rect(center=(center_x, center_y))
-        self.screen.blit(uno_text, uno_rect)
+        surf.blit(uno_text, uno_text.get_rect(center=center))
+        surf.set_colorkey(CARD_KEY, pygame.RLEACCEL)
+        return surf
+    
+    def draw_discard_pile(self):
+        top_card = self.game.get_top_card()
+        x = WINDOW_WIDTH // 2 - CARD_WIDTH - 20
+        y = WINDOW_HEIGHT // 2 - CARD_HEIGHT // 2
+        # deck, top card, color box and pending box; the deck and the color box
+        # frame come from the static background
+        self._dirty_rects.append(pygame.Rect(x - 100, y, 270, CARD_HEIGHT + 100))
         
-        deck_count = self.tiny_font.render(f"{len(self.game.deck)} cards", True, WHITE)
+        deck_count = self._text(f"{len(self.game.deck)} cards", self.tiny_font, WHITE)
         self.screen.blit(deck_count, (x - 95, y + CARD_HEIGHT + 5))
         
         self.draw_card(top_card, x + 20, y, face_up=True)
         
         # Show current color and pending effects
         info_y = y + CARD_HEIGHT + 30
-        color_bg = pygame.Rect(x - 10, info_y, 180, 30)
-        pygame.draw.rect(self.screen, WHITE, color_bg, border_radius=5)
-        pygame.draw.rect(self.screen, BLACK, color_bg, width=2, border_radius=5)
-        color_text = self.small_font.render(f"Color: {self.game.current_color.name}", True, BLACK)
+        color_text = self._text(f"Color: {self.game.current_color.name}", self.small_font, BLACK)
         self.screen.blit(color_text, (x, info_y + 5))
         
         # Show pending draw
@@ -211,28 +361,66 @@ class UnoGUI:
             pending_bg = pygame.Rect(x - 10, info_y + 40, 180, 30)
             pygame.draw.rect(self.screen, RED, pending_bg, border_radius=5)
             pygame.draw.rect(self.screen, BLACK, pending_bg, width=2, border_radius=5)
-            pending_text = self.small_font.render(f"+{self.game.pending_draw} PENDING!", True, WHITE)
+            pending_text = self._text(f"+{self.game.pending_draw} PENDING!", self.small_font, WHITE)
             self.screen.blit(pending_text, (x, info_y + 45))
     
-    def draw_button(self, rect, text, color=DARK_GREEN, enabled=True):
+    def draw_button(self, rect, text, color=DARK_GREEN, enabled=True, target=None):
+        # `target` is the Surface to draw on (defaults to the screen)
+        if target is None:
+            target = self.screen
+            self._dirty_rects.append(rect)
         btn_color = color if enabled else GRAY
-        pygame.draw.rect(self.screen, btn_color, rect, border_radius=5)
-        pygame.draw.rect(self.screen, BLACK, rect, width=2, border_radius=5)
+        pygame.draw.rect(target, btn_color, rect, border_radius=5)
+        pygame.draw.rect(target, BLACK, rect, width=2, border_radius=5)
         
         lines = text.split('\n')
         if len(lines) == 1:
-            text_surface = self.small_font.render(text, True, WHITE)
+            text_surface = self._text(text, self.small_font, WHITE)
             text_rect = text_surface.get_rect(center=rect.center)
-            self.screen.blit(text_surface, text_rect)
+            target.blit(text_surface, text_rect)
         else:
             for i, line in enumerate(lines):
-                text_surface = self.tiny_font.render(line, True, WHITE)
+                text_surface = self._text(line, self.tiny_font, WHITE)
                 text_rect = text_surface.get_rect(center=(rect.centerx, rect.centery - 10 + i * 20))
-                self.screen.blit(text_surface, text_rect)
+                target.blit(text_surface, text_rect)
+    
+    def _build_static_bg(self):
+        """
+        Compose everything that only changes on user action into self._static_bg:
+        the green table, the buttons, the face-down deck and the frames of the
+        color-info and stats boxes. run() blits it instead of fill(GREEN) and
+        redrawing those pieces, and rebuilds it when _bg_dirty is set (the
+        OPPONENT button label follows opponent_type).
+        """
+        bg = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        bg.fill(GREEN)
+        
+        self.draw_button(self.train_button_rect, "TRAIN AI\n(1000 games)", PURPLE, target=bg)
+        self.draw_button(self.train_curriculum_rect, "CURRICULUM\n(4000 games)", (100, 50, 150), target=bg)
+        self.draw_button(self.new_game_button_rect, "NEW GAME", target=bg)
+        self.draw_button(self.end_game_button_rect, "END GAME", target=bg)
+        self.draw_button(self.opponent_button_rect, f"OPPONENT:\n{self.opponent_type[:8].upper()}", CYAN, target=bg)
+        
+        # Same position as in draw_discard_pile
+        x = WINDOW_WIDTH // 2 - CARD_WIDTH - 20
+        y = WINDOW_HEIGHT // 2 - CARD_HEIGHT // 2
+        if self._deck_back_surf is None:
+            self._deck_back_surf = self._build_deck_back_surf()
+        bg.blit(self._deck_back_surf, (x - 100, y))
+        
+        color_bg = pygame.Rect(x - 10, y + CARD_HEIGHT + 30, 180, 30)
+        pygame.draw.rect(bg, WHITE, color_bg, border_radius=5)
+        pygame.draw.rect(bg, BLACK, color_bg, width=2, border_radius=5)
+        
+        pygame.draw.rect(bg, WHITE, self.stats_rect, border_radius=5)
+        pygame.draw.rect(bg, BLACK, self.stats_rect, width=2, border_radius=5)
+        
+        self._static_bg = bg
+        self._bg_dirty = False
     
     def draw_stats(self):
-        pygame.draw.rect(self.screen, WHITE, self.stats_rect, border_radius=5)
-        pygame.draw.rect(self.screen, BLACK, self.stats_rect, width=2, border_radius=5)
+        # the box itself is part of the static background
+        self._dirty_rects.append(self.stats_rect)
         
         stats_lines = [
             f"AI: {self.agent.name}",
@@ -252,13 +440,13 @@ class UnoGUI:
         #     text = self.tiny_font.render(line, True, BLACK)
         #     self.screen.blit(text, (self.stats_rect.x + 10, self.stats_rect.y + 10 + i * 19))
         for i, line in enumerate(stats_lines):
-            text = self.tiny_font.render(line, True, BLACK)
+            text = self._text(line, self.tiny_font, BLACK)
             self.screen.blit(text, (self.stats_rect.x + 10, self.stats_rect.y + 10 + i * 16))
 
     
     def draw_notification(self):
         if self.notification_timer > 0:
-            text_surface = self.font.render(self.notification, True, BLACK)
+            text_surface = self._text(self.notification, self.font, BLACK)
             text_rect = text_surface.get_rect()
             
             box_width = text_rect.width + 40
@@ -267,17 +455,21 @@ class UnoGUI:
             box_y = WINDOW_HEIGHT // 2 - 200
             
             bg_rect = pygame.Rect(box_x, box_y, box_width, box_height)
+            self._dirty_rects.append(bg_rect)
             pygame.draw.rect(self.screen, self.notification_color, bg_rect, border_radius=10)
             pygame.draw.rect(self.screen, BLACK, bg_rect, width=3, border_radius=10)
             
             text_rect.center = (WINDOW_WIDTH // 2, box_y + box_height // 2)
             self.screen.blit(text_surface, text_rect)
             self.notification_timer -= 1
+            if self.notification_timer == 0:
+                # one more frame to clear it
+                self._needs_redraw = True
     
     def draw_action_effect(self):
         """Draw action card effect notification"""
         if self.action_effect_timer > 0:
-            text_surface = self.small_font.render(self.action_effect, True, WHITE)
+            text_surface = self._text(self.action_effect, self.small_font, WHITE)
             text_rect = text_surface.get_rect()
             
             box_width = text_rect.width + 30
@@ -286,105 +478,143 @@ class UnoGUI:
             box_y = WINDOW_HEIGHT // 2 + 150
             
             bg_rect = pygame.Rect(box_x, box_y, box_width, box_height)
+            self._dirty_rects.append(bg_rect)
             pygame.draw.rect(self.screen, ORANGE, bg_rect, border_radius=8)
             pygame.draw.rect(self.screen, BLACK, bg_rect, width=2, border_radius=8)
             
             text_rect.center = (WINDOW_WIDTH // 2, box_y + box_height // 2)
             self.screen.blit(text_surface, text_rect)
             self.action_effect_timer -= 1
+            if self.action_effect_timer == 0:
+                self._needs_redraw = True
     
-    def draw_color_choice(self):
+    def _compute_color_choice_rects(self):
         colors = [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]
-        color_names = ["RED", "BLUE", "GREEN", "YELLOW"]
-        
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        instruction = self.font.render("Choose a color!", True, WHITE)
-        inst_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120))
-        self.screen.blit(instruction, inst_rect)
-        
         box_size = 100
         start_x = (WINDOW_WIDTH - len(colors) * (box_size + 20)) // 2
         y = WINDOW_HEIGHT // 2 - box_size // 2
+        return [(pygame.Rect(start_x + i * (box_size + 20), y, box_size, box_size), color)
+                for i, color in enumerate(colors)]
+    
+    def _build_color_choice_panel(self):
+        """The picker's title, color boxes and labels on a transparent window-sized Surface."""
+        panel = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
         
-        rects = []
-        for i, (color, name) in enumerate(zip(colors, color_names)):
-            x = start_x + i * (box_size + 20)
-            rect = pygame.Rect(x, y, box_size, box_size)
-            
-            color_rgb = self.get_color_rgb(color)
-            mouse_pos = pygame.mouse.get_pos()
-            if rect.collidepoint(mouse_pos):
-                hover_rect = pygame.Rect(x - 5, y - 5, box_size + 10, box_size + 10)
-                pygame.draw.rect(self.screen, YELLOW, hover_rect, border_radius=15)
-            
-            pygame.draw.rect(self.screen, color_rgb, rect, border_radius=10)
-            pygame.draw.rect(self.screen, BLACK, rect, width=3, border_radius=10)
-            
-            text = self.small_font.render(name, True, WHITE)
-            text_rect = text.get_rect(center=(x + box_size // 2, y + box_size + 20))
-            self.screen.blit(text, text_rect)
+        instruction = self._text("Choose a color!", self.font, WHITE)
+        inst_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120))
+        panel.blit(instruction, inst_rect)
+        
+        for rect, color in self.color_choice_rects:
+            pygame.draw.rect(panel, self.get_color_rgb(color), rect, border_radius=10)
+            pygame.draw.rect(panel, BLACK, rect, width=3, border_radius=10)
             
-            rects.append((rect, color))
+            text = self._text(color.name, self.small_font, WHITE)
+            text_rect = text.get_rect(center=(rect.centerx, rect.bottom + 20))
+            panel.blit(text, text_rect)
         
-        return rects
+        return panel.convert_alpha()
+    
+    def draw_color_choice(self):
+        self.screen.blit(self._dim_overlay_128, (0, 0))
+        
+        # The hover glow sits behind its box, so it goes down before the panel
+        mouse_pos = pygame.mouse.get_pos()
+        hit = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._color_choice_boxes)
+        if hit != -1:
+            hover_rect = self._color_choice_boxes[hit].inflate(10, 10)
+            pygame.draw.rect(self.screen, YELLOW, hover_rect, border_radius=15)
+        
+        if self._color_choice_panel is None:
+            self._color_choice_panel = self._build_color_choice_panel()
+        self.screen.blit(self._color_choice_panel, (0, 0))
+        
+        return self.color_choice_rects
     
     def get_color_rgb(self, color):
-        color_map = {
-            Color.RED: (220, 20, 60),
-            Color.BLUE: (30, 144, 255),
-            Color.GREEN: (50, 205, 50),
-            Color.YELLOW: (255, 215, 0)
-        }
-        return color_map[color]
+        return COLOR_RGB[color.value]
+    
+    def get_hand_rects(self, n, y_pos):
+        """
+        Rects of an n-card hand drawn at y_pos, built once per layout and shared
+        between frames (callers must not modify them).
+        """
+        key = (n, y_pos)
+        rects = self._hand_rects.get(key)
+        if rects is None:
+            start_x = (WINDOW_WIDTH - n * HAND_SPACING) // 2
+            rects = self._hand_rects[key] = [pygame.Rect(start_x + i * HAND_SPACING, y_pos, CARD_WIDTH, CARD_HEIGHT)
+                                             for i in range(n)]
+        return rects
+    
+    def get_player_hand_rects(self):
+        """Rects of the player's cards; only rebuilt when the hand size changes."""
+        return self.get_hand_rects(len(self.game.player_hand), PLAYER_HAND_Y)
+    
+    def get_player_valid_cards(self):
+        """
+        The player's playable card indices, recomputed only when the game's
+        hands/top card (state_version) or the pending draw have changed.
+        """
+        key = (self.game.state_version, self.game.pending_draw)
+        if key != self._player_valid_key:
+            self._player_valid = self.game.get_valid_cards(self.game.player_hand)
+            self._player_valid_key = key
+        return self._player_valid
+    
+    def card_index_at(self, mouse_pos, card_rects):
+        """Index of the card under mouse_pos, or None. Cards are evenly spaced, so no scan is needed."""
+        if not card_rects:
+            return None
+        i = (mouse_pos[0] - card_rects[0].x) // HAND_SPACING
+        if 0 <= i < len(card_rects) and card_rects[i].collidepoint(mouse_pos):
+            return i
+        return None
+    
     def handle_player_turn(self, mouse_pos, card_rects, valid_cards):
         # --- PLAY CARD ---
-        for i, rect in enumerate(card_rects):
-            if rect.collidepoint(mouse_pos):
-                card = self.game.player_hand[i]
+        i = self.card_index_at(mouse_pos, card_rects)
+        if i is not None:
+            card = self.game.player_hand[i]
 
-                # Check if card is valid to play
-                if i not in valid_cards:
-                    self.show_notification("Invalid card! Must match color/number/type.", RED, 90)
-                    return
+            # Check if card is valid to play
+            if i not in valid_cards:
+                self.show_notification("Invalid card! Must match color/number/type.", RED, 90)
+                return
 
-                # Wild requires color selection
-                if card.color == Color.WILD:
-                    self.selected_card = i
-                    self.choosing_color = True
-                    self.show_notification("Choose a color!", LIGHT_GRAY, 60)
-                    return
+            # Wild requires color selection
+            if card.color == Color.WILD:
+                self.selected_card = i
+                self.choosing_color = True
+                self.show_notification("Choose a color!", LIGHT_GRAY, 60)
+                return
 
-                # Play normal or action card
-                played = self.game.play_card(0, i)
-                if played:
-                    # Apply messages
-                    if card.card_type == CardType.DRAW_TWO:
-                        self.show_action_effect("💥 You played +2! AI must draw 2!")
-                    elif card.card_type==CardType.WILD_DRAW_FOUR:  
-                        self.show_action_effect("💥💥 you played +4! AI draws 4!")  
-                    elif card.card_type == CardType.SKIP:
-                        self.show_action_effect("⏭️ You played Skip!")
-                    elif card.card_type == CardType.REVERSE:
-                        self.show_action_effect("🔄 You played Reverse!")
-
-                    self.show_notification(f"You played {card}!", GREEN, 60)
-
-                    # If game not over → switch turn
-                    # --- TURN LOGIC FIX FOR SKIP / REVERSE ---
-                    if not self.game.game_over:
-                        if card.card_type in (CardType.SKIP, CardType.REVERSE):
-                            # player gets another turn → do NOT switch
-                            self.show_notification("player gets another turn!", LIGHT_GRAY)
-                            self.ai_delay = 40
-                        else:
-                            # Normal turn → switch to ai
-                            self.game.switch_turn()
+            # Play normal or action card
+            played = self.game.play_card(0, i)
+            if played:
+                # Apply messages
+                if card.card_type == CardType.DRAW_TWO:
+                    self.show_action_effect("You played +2! AI must draw 2!")
+                elif card.card_type==CardType.WILD_DRAW_FOUR:  
+                    self.show_action_effect("You played +4! AI draws 4!")
+                elif card.card_type == CardType.SKIP:
+                    self.show_action_effect("You played Skip!")
+                elif card.card_type == CardType.REVERSE:
+                    self.show_action_effect("You played Reverse!")
+
+                self.show_notification(f"You played {card}!", GREEN, 60)
+
+                # If game not over → switch turn
+                # --- TURN LOGIC FIX FOR SKIP / REVERSE ---
+                if not self.game.game_over:
+                    if card.card_type in (CardType.SKIP, CardType.REVERSE):
+                        # player gets another turn → do NOT switch
+                        self.show_notification("player gets another turn!", LIGHT_GRAY)
+                        self.ai_delay = 40
+                    else:
+                        # Normal turn → switch to ai
+                        self.game.switch_turn()
 
-                return
+            return
 
         # --- DRAW CARD ---
         if self.deck_rect.collidepoint(mouse_pos):
@@ -490,59 +720,165 @@ class UnoGUI:
             self.game.switch_turn()
     
     def run_training(self, num_episodes=1000, curriculum=False):
+        """
+        Start training the agent in a background thread and return immediately.
+        run() shows a progress screen until TRAINING_DONE_EVENT arrives.
+        """
+        if self.training_mode:
+            return
         self.training_mode = True
+        self._training_started = pygame.time.get_ticks()
+        self._training_games_base = self.agent.games_played
+        # train_with_curriculum plays 1000 + 1000 + 2000 episodes
+        self._training_games_total = 4000 if curriculum else num_episodes
         
         if curriculum:
-            self.show_notification("Curriculum Training... Check terminal!", YELLOW, 240)
+            self._training_label = "Curriculum Training... Check terminal!"
             print("\n" + "="*60)
             print("STARTING CURRICULUM TRAINING")
             print("="*60)
-            train_with_curriculum(self.agent, show_progress=True)
         else:
-            self.show_notification(f"Training {num_episodes} games... Check terminal!", YELLOW, 180)
+            self._training_label = f"Training {num_episodes} games... Check terminal!"
             print(f"\nTraining AI for {num_episodes} games...")
+        
+        # daemon: a second close while training exits without waiting for the trainer
+        # (save_model is atomic, so the saved model is never left half written)
+        self._training_thread = threading.Thread(target=self._train_worker,
+                                                 args=(num_episodes, curriculum), daemon=True)
+        self._training_thread.start()
+    
+    def _train_worker(self, num_episodes, curriculum):
+        # Runs on the training thread; the main loop doesn't touch the agent meanwhile
+        if curriculum:
+            train_with_curriculum(self.agent, show_progress=True)
+        else:
             train_agent(self.agent, num_episodes, opponent_type='mixed', show_progress=True)
         
-        self.agent.save_model()
+        self.agent.save_model(MODEL_FILE)
         print(f"\nTraining complete!")
         print(f"Win rate: {self.agent.get_win_rate():.2%}")
         print(f"Q-table size: {len(self.agent.q_table)} states")
-        
+        try:
+            pygame.event.post(pygame.event.Event(TRAINING_DONE_EVENT))
+        except pygame.error:
+            # display already shut down
+            pass
+    
+    def finish_training(self):
+        """Back to the game once the training thread has posted TRAINING_DONE_EVENT."""
+        self._training_thread.join()
+        self._training_thread = None
         self.training_mode = False
         self.game.reset()
+        self._full_flip = True
         self.show_notification("Training complete! AI is ready!", GREEN, 120)
     
+    def quit_during_training(self):
+        """
+        First close while training: keep running until the trainer has saved,
+        then exit. A second close exits right away and discards the training.
+        """
+        if self._quit_after_training:
+            return False
+        self._quit_after_training = True
+        self._training_label = "Closing once training is saved... (close again to discard)"
+        print("\nWindow closed: exiting after training finishes and the model is saved.")
+        return True
+    
+    def draw_training_screen(self):
+        """Lightweight frame while training: no game state, hands or agent stats."""
+        self.screen.fill(GREEN)
+        elapsed = (pygame.time.get_ticks() - self._training_started) // 1000
+        label = self._text(self._training_label, self.font, YELLOW)
+        self.screen.blit(label, label.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 20)))
+        # games_played is a plain int the trainer bumps once per episode; reading
+        # it from this thread is safe and needs no queue
+        done = self.agent.games_played - self._training_games_base
+        timer = self._text(f"Games: {done}/{self._training_games_total}   Elapsed: {elapsed}s",
+                           self.small_font, WHITE)
+        self.screen.blit(timer, timer.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 25)))
+    
     def cycle_opponent(self):
         types = ['q-learning', 'random', 'heuristic']
         current_idx = types.index(self.opponent_type)
         self.opponent_type = types[(current_idx + 1) % len(types)]
+        self._bg_dirty = True
         self.show_notification(f"Opponent: {self.opponent_type.title()}", CYAN, 90)
     
+    def present(self, overlay=False):
+        """
+        Push this frame to the display: only the rects drawn this frame and last
+        frame (things move or disappear), or the whole window after an overlay or
+        when the dirty area is large anyway.
+        """
+        rects = self._dirty_rects + self._prev_dirty_rects
+        area = sum(r.width * r.height for r in rects)
+        if self._full_flip or overlay or area > FULL_FLIP_AREA * WINDOW_WIDTH * WINDOW_HEIGHT:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        # the frame after an overlay has to replace all of it
+        self._full_flip = overlay
+        self._prev_dirty_rects = self._dirty_rects
+        self._dirty_rects = []
+    
+    def frame_changed(self):
+        """True when the screen differs from the last frame drawn."""
+        return (self._needs_redraw or self.choosing_color
+                or self.notification_timer > 0 or self.action_effect_timer > 0)
+    
+    def is_idle(self):
+        """
+        True when nothing is counting down, animating or waiting on the AI and
+        the last frame is still current, so run() can sleep until the next event.
+        """
+        return not (self.training_mode or self.frame_changed()
+                    or (self.game.current_player == 1 and not self.game.game_over))
+    
     def run(self):
         running = True
         
         while running:
-            self.clock.tick(FPS)
-            mouse_pos = pygame.mouse.get_pos()
+            if self.is_idle():
+                # Human's turn (or game over) and nothing on screen changes by itself
+                events = [pygame.event.wait()] + pygame.event.get()
+            else:
+                self.clock.tick(TRAINING_FPS if self.training_mode else FPS)
+                events = pygame.event.get()
             
-            for event in pygame.event.get():
+            for event in events:
+                # every event we let through can change what's shown
+                self._needs_redraw = True
+                
                 if event.type == pygame.QUIT:
-                    running = False
+                    if not (self.training_mode and self.quit_during_training()):
+                        running = False
+                
+                if event.type == TRAINING_DONE_EVENT:
+                    self.finish_training()
+                    if self._quit_after_training:
+                        running = False
+                
+                # window uncovered: everything has to be pushed again
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self._full_flip = True
                 
                 if event.type == pygame.MOUSEBUTTONDOWN and not self.training_mode:
-                    mouse_pos = pygame.mouse.get_pos()
+                    # where the click happened, not where the cursor is by now
+                    mouse_pos = event.pos
                     
                     if self.choosing_color:
-                        color_rects = self.draw_color_choice()
-                        for rect, color in color_rects:
-                            if rect.collidepoint(mouse_pos):
-                                self.game.play_card(0, self.selected_card, color)
-                                self.choosing_color = False
-                                self.selected_card = None
-                                self.show_notification(f"Chose {color.name}!", GREEN)
-                                if not self.game.game_over:
-                                    self.game.switch_turn()
-                                    self.ai_delay = 40
+                        # the boxes don't overlap: at most one hit
+                        hit = pygame.Rect(mouse_pos, (1, 1)).collidelist(self._color_choice_boxes)
+                        if hit != -1:
+                            color = self.color_choice_rects[hit][1]
+                            self.game.play_card(0, self.selected_card, color)
+                            self.choosing_color = False
+                            self.selected_card = None
+                            self.show_notification(f"Chose {color.name}!", GREEN)
+                            if not self.game.game_over:
+                                self.game.switch_turn()
+                                self.ai_delay = 40
                         continue
                     
                     if self.train_button_rect.collidepoint(mouse_pos):
@@ -573,50 +909,53 @@ class UnoGUI:
                         continue
                     
                     if self.game.current_player == 0 and not self.game.game_over:
-                        spacing = 90
-                        total_width = len(self.game.player_hand) * spacing
-                        start_x = (WINDOW_WIDTH - total_width) // 2
-                        y_pos = WINDOW_HEIGHT - 180
-                        
-                        card_rects = []
-                        for i in range(len(self.game.player_hand)):
-                            x = start_x + i * spacing
-                            card_rects.append(pygame.Rect(x, y_pos, CARD_WIDTH, CARD_HEIGHT))
-                        
-                        valid_cards = self.game.get_valid_cards(self.game.player_hand)
+                        card_rects = self.get_player_hand_rects()
+                        valid_cards = self.get_player_valid_cards()
                         self.handle_player_turn(mouse_pos, card_rects, valid_cards)
             
-            if self.game.current_player == 1 and not self.game.game_over and not self.training_mode:
+            if self.training_mode:
+                self.draw_training_screen()
+                self.present(overlay=True)
+                continue
+            
+            if self.game.current_player == 1 and not self.game.game_over:
+                # the AI's move delay counts frames; those frames look the same
+                moved = self.ai_delay == 0
                 self.handle_ai_turn()
+                if moved:
+                    self._needs_redraw = True
+            
+            if not self.frame_changed():
+                continue
+            self._needs_redraw = False
             
-            self.screen.fill(GREEN)
+            if self._bg_dirty:
+                self._build_static_bg()
+                self._dirty_rects.append(self.opponent_button_rect)
+            self.screen.blit(self._static_bg, (0, 0))
             
             self.draw_discard_pile()
-            self.draw_button(self.train_button_rect, "TRAIN AI\n(1000 games)", PURPLE)
-            self.draw_button(self.train_curriculum_rect, "CURRICULUM\n(4000 games)", (100, 50, 150))
-            self.draw_button(self.new_game_button_rect, "NEW GAME")
-            self.draw_button(self.end_game_button_rect,"END GAME")
             # self.draw_button(self.toggle_q_button_rect, f"Q-VALUES\n({'ON' if self.show_q_values else 'OFF'})", ORANGE)
-            self.draw_button(self.opponent_button_rect, f"OPPONENT:\n{self.opponent_type[:8].upper()}", CYAN)
             self.draw_stats()
             
-            state = self.game.get_state_for_ai(0) if self.game.current_player == 0 else None
+            # only the Q-value badges read the state
+            state = self.game.get_state_for_ai(0) if self.show_q_values and self.game.current_player == 0 else None
             card_rects, valid_cards = self.draw_player_hand(
-                self.game.player_hand, WINDOW_HEIGHT - 180, 
+                self.game.player_hand, PLAYER_HAND_Y, 
                 face_up=True, check_valid=True, show_q=self.show_q_values, state=state
             )
             self.draw_player_hand(self.game.ai_hand, 120, face_up=False)
             
             turn_text = "YOUR TURN!" if self.game.current_player == 0 else f"AI's Turn ({self.opponent_type})..."
             turn_color = YELLOW if self.game.current_player == 0 else LIGHT_GRAY
-            turn_surface = self.font.render(turn_text, True, turn_color)
+            turn_surface = self._text(turn_text, self.font, turn_color)
             turn_rect = turn_surface.get_rect(center=(WINDOW_WIDTH // 2, 35))
-            self.screen.blit(turn_surface, turn_rect)
+            self._dirty_rects.append(self.screen.blit(turn_surface, turn_rect))
             
-            player_count = self.small_font.render(f"Your cards: {len(self.game.player_hand)}", True, WHITE)
-            ai_count = self.small_font.render(f"AI cards: {len(self.game.ai_hand)}", True, WHITE)
-            self.screen.blit(player_count, (20, WINDOW_HEIGHT - 70))
-            self.screen.blit(ai_count, (20, 110))
+            player_count = self._text(f"Your cards: {len(self.game.player_hand)}", self.small_font, WHITE)
+            ai_count = self._text(f"AI cards: {len(self.game.ai_hand)}", self.small_font, WHITE)
+            self._dirty_rects.append(self.screen.blit(player_count, (20, WINDOW_HEIGHT - 70)))
+            self._dirty_rects.append(self.screen.blit(ai_count, (20, 110)))
             
             self.draw_notification()
             self.draw_action_effect()
@@ -625,22 +964,19 @@ class UnoGUI:
                 self.draw_color_choice()
             
             if self.game.game_over:
-                overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-                overlay.set_alpha(200)
-                overlay.fill(BLACK)
-                self.screen.blit(overlay, (0, 0))
+                self.screen.blit(self._dim_overlay_200, (0, 0))
                 
                 winner_text = "YOU WIN!" if self.game.winner == 0 else f"AI ({self.opponent_type.upper()}) WINS!"
                 win_color = (0, 255, 0) if self.game.winner == 0 else (255, 50, 50)
-                text = self.font.render(winner_text, True, win_color)
+                text = self._text(winner_text, self.font, win_color)
                 text_rect = text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
                 self.screen.blit(text, text_rect)
                 
-                restart_text = self.small_font.render("Click NEW GAME to play again", True, WHITE)
+                restart_text = self._text("Click NEW GAME to play again", self.small_font, WHITE)
                 restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
                 self.screen.blit(restart_text, restart_rect)
             
-            pygame.display.flip()
+            self.present(overlay=self.choosing_color or self.game.game_over)
         
         pygame.quit()
         sys.exit()
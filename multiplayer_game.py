@@ -2,7 +2,7 @@
 
 import random
 from collections import deque
-from uno_game import Color, CardType, Card  # reuse Card, Color, CardType
+from uno_game import Color, CardType, Card, STACKABLE_TYPES, ACTION_TYPES, DECK_TEMPLATE, WILD_CHOICES  # reuse Card, Color, CardType
 
 class MultiplayerGame:
     """
@@ -12,6 +12,8 @@ class MultiplayerGame:
     - direction: 1 or -1
     - pending_draw: stacked draw penalty
     - skip_next: boolean (skips the immediate next player)
+    - hand_versions[p]: bumped whenever hand p changes (cheap change marker for caches)
+    - state_version: bumped whenever a hand, the top card or the color changes
     """
 
     def __init__(self, num_players=2):
@@ -22,37 +24,45 @@ class MultiplayerGame:
         self.skip_next = False
         self.turns_played = 0
         self.discard_history = []
-        self.last_action_cards = []
+        self.last_action_cards = deque(maxlen=8)
+        self.state_version = 0
         self.reset()
 
     def create_deck(self):
-        deck = []
-        for color in [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]:
-            deck.append(Card(color, CardType.NUMBER, 0))
-            for num in range(1, 10):
-                deck.extend([Card(color, CardType.NUMBER, num)] * 2)
-            for _ in range(2):
-                deck.append(Card(color, CardType.SKIP, None))
-                deck.append(Card(color, CardType.REVERSE, None))
-                deck.append(Card(color, CardType.DRAW_TWO, None))
-        for _ in range(4):
-            deck.append(Card(Color.WILD, CardType.WILD, None))
-            deck.append(Card(Color.WILD, CardType.WILD_DRAW_FOUR, None))
-        return deck
+        # same 108 cards and order as UnoGame; Card objects are shared, never mutated
+        return list(DECK_TEMPLATE)
 
     def reset(self):
         self.deck = self.create_deck()
         random.shuffle(self.deck)
-        self.hands = [[self.deck.pop() for _ in range(7)] for _ in range(self.num_players)]
-        # start discard with a number
-        while True:
-            c = self.deck.pop()
-            if c.card_type == CardType.NUMBER:
-                self.discard_pile = [c]
-                break
-            else:
-                # place non-number into deck bottom
-                self.deck.insert(0, c)
+        # deal 7 cards each in one slice off the end, reversed into pop() order
+        n = 7 * self.num_players
+        dealt = self.deck[-n:][::-1]
+        del self.deck[-n:]
+        self.hands = [dealt[i:i + 7] for i in range(0, n, 7)]
+        self.hand_versions = [0] * self.num_players
+        # per-player RED/BLUE/GREEN/YELLOW card counts, kept up to date by
+        # draw_card/play_card so choose_color_for_wild doesn't scan the hand
+        self._color_counts = [[0, 0, 0, 0] for _ in range(self.num_players)]
+        # per-player hand sizes, maintained alongside the hands for get_state_for_ai
+        self._hand_counts = [7] * self.num_players
+        # last get_valid_cards() result and the (state_version, pending_draw, player) it is for
+        self._valid_key = None
+        self._valid = []
+        self.state_version += 1
+        for counts, hand in zip(self._color_counts, self.hands):
+            for c in hand:
+                if c.color is not Color.WILD:
+                    counts[c.color.value] += 1
+        # start discard with a number: the topmost number card (the deck is popped
+        # from the end) starts the pile, and the non-numbers above it go to the
+        # bottom of the deck in their current order
+        deck = self.deck
+        top = len(deck) - 1
+        while deck[top].card_type is not CardType.NUMBER:
+            top -= 1
+        self.discard_pile = [deck[top]]
+        self.deck = deck[top + 1:] + deck[:top]
         self.current_color = self.discard_pile[0].color
         self.current_player = 0
         self.direction = 1
@@ -62,7 +72,7 @@ class MultiplayerGame:
         self.winner = None
         self.turns_played = 0
         self.discard_history = [self.discard_pile[0]]
-        self.last_action_cards = []
+        self.last_action_cards = deque(maxlen=8)
 
     def get_top_card(self):
         return self.discard_pile[-1]
@@ -71,16 +81,37 @@ class MultiplayerGame:
         if len(self.deck) == 0:
             if len(self.discard_pile) > 1:
                 top = self.discard_pile.pop()
-                self.deck = self.discard_pile[:]
+                # the old pile list becomes the deck; no copy needed
+                self.deck = self.discard_pile
                 random.shuffle(self.deck)
                 self.discard_pile = [top]
             else:
                 return None
         card = self.deck.pop()
         self.hands[player].append(card)
+        self._hand_counts[player] += 1
+        self.hand_versions[player] += 1
+        self.state_version += 1
+        if card.color is not Color.WILD:
+            self._color_counts[player][card.color.value] += 1
         return card
 
     def draw_multiple_cards(self, player, count):
+        deck = self.deck
+        if 0 < count <= len(deck):
+            # no reshuffle can happen: take the top `count` cards in one slice,
+            # in the same order repeated pops would give
+            drawn = deck[-count:][::-1]
+            del deck[-count:]
+            self.hands[player].extend(drawn)
+            self._hand_counts[player] += count
+            self.hand_versions[player] += 1
+            self.state_version += 1
+            counts = self._color_counts[player]
+            for c in drawn:
+                if c.color is not Color.WILD:
+                    counts[c.color.value] += 1
+            return drawn
         drawn = []
         for _ in range(count):
             c = self.draw_card(player)
@@ -89,33 +120,34 @@ class MultiplayerGame:
         return drawn
 
     def get_valid_cards(self, hand_index):
+        # The GUIs ask again for the same turn (request the move, then apply it); the
+        # returned list is shared between those calls, so callers must not modify it
+        key = (self.state_version, self.pending_draw, hand_index)
+        if key == self._valid_key:
+            return self._valid
         hand = self.hands[hand_index]
-        top = self.get_top_card()
-        valid = []
         if self.pending_draw > 0:
-            for i, c in enumerate(hand):
-                if c.card_type in (CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR):
-                    valid.append(i)
-            return valid
-        for i, c in enumerate(hand):
-            if c.color == Color.WILD:
-                valid.append(i)
-            elif c.color == self.current_color:
-                valid.append(i)
-            elif c.card_type == CardType.NUMBER and top.card_type == CardType.NUMBER and c.number == top.number:
-                valid.append(i)
-            elif c.card_type == top.card_type and c.card_type != CardType.NUMBER:
-                valid.append(i)
+            valid = [i for i, c in enumerate(hand) if c.card_type in STACKABLE_TYPES]
+        else:
+            # hoist the top card and enum lookups out of the per-card test
+            top = self.get_top_card()
+            top_type, top_number = top.card_type, top.number
+            current_color = self.current_color
+            wild, number = Color.WILD, CardType.NUMBER
+            valid = [i for i, c in enumerate(hand)
+                     if c.color is wild or c.color is current_color
+                     or (c.card_type is top_type and (top_type is not number or c.number == top_number))]
+        self._valid_key = key
+        self._valid = valid
         return valid
 
     def choose_color_for_wild(self, hand_index):
-        counts = {Color.RED:0, Color.BLUE:0, Color.GREEN:0, Color.YELLOW:0}
-        for c in self.hands[hand_index]:
-            if c.color in counts:
-                counts[c.color] += 1
-        if max(counts.values()) == 0:
-            return random.choice([Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW])
-        return max(counts, key=counts.get)
+        # most common color in the hand (first in WILD_CHOICES order on ties)
+        counts = self._color_counts[hand_index]
+        best = max(counts)
+        if best == 0:
+            return random.choice(list(WILD_CHOICES))
+        return WILD_CHOICES[counts.index(best)]
 
     def play_card(self, player, card_index, chosen_color=None):
         if self.game_over:
@@ -126,21 +158,25 @@ class MultiplayerGame:
         card = hand[card_index]
         top = self.get_top_card()
         if not card.can_play_on(top, self.current_color):
-            if self.pending_draw > 0 and card.card_type not in (CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR):
+            if self.pending_draw > 0 and card.card_type not in STACKABLE_TYPES:
                 return False
             if self.pending_draw == 0:
                 return False
         played = hand.pop(card_index)
+        self._hand_counts[player] -= 1
+        self.hand_versions[player] += 1
+        self.state_version += 1
+        if played.color is not Color.WILD:
+            self._color_counts[player][played.color.value] -= 1
         self.discard_pile.append(played)
         self.discard_history.append(played)
         self.turns_played += 1
-        if played.card_type in (CardType.SKIP, CardType.REVERSE, CardType.DRAW_TWO, CardType.WILD, CardType.WILD_DRAW_FOUR):
+        if played.card_type in ACTION_TYPES:
+            # maxlen=8 evicts the oldest
             self.last_action_cards.append(played)
-            if len(self.last_action_cards) > 8:
-                self.last_action_cards.pop(0)
         # handle wild color
         if played.color == Color.WILD:
-            if chosen_color:
+            if chosen_color is not None:
                 self.current_color = chosen_color
             else:
                 self.current_color = self.choose_color_for_wild(player)
@@ -171,8 +207,7 @@ class MultiplayerGame:
         if self.pending_draw > 0:
             # can counter?
             hand = self.hands[player]
-            counters = [i for i,c in enumerate(hand) if c.card_type in (CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR)]
-            if not counters:
+            if not any(c.card_type in STACKABLE_TYPES for c in hand):
                 self.draw_multiple_cards(player, self.pending_draw)
                 self.pending_draw = 0
                 return False
@@ -191,15 +226,19 @@ class MultiplayerGame:
             self.current_player = (self.current_player + self.direction) % self.num_players
 
     def get_hand(self, player):
-        return list(self.hands[player])
+        # immutable snapshot; a tuple copy is cheaper than a list copy (no over-allocation)
+        return tuple(self.hands[player])
 
     def get_state_for_ai(self, perspective_player=0):
+        # 'hand' is the player's live hand list, not a copy: agents only read it.
+        # Callers handing the state to another thread must copy it first.
+        counts = self._hand_counts
         return {
-            'hand': self.get_hand(perspective_player),
+            'hand': self.hands[perspective_player],
             'top_card': self.get_top_card(),
             'current_color': self.current_color,
-            'opponent_counts': [len(self.hands[i]) for i in range(self.num_players) if i != perspective_player],
-            'my_card_count': len(self.hands[perspective_player]),
+            'opponent_counts': counts[:perspective_player] + counts[perspective_player + 1:],
+            'my_card_count': counts[perspective_player],
             'deck_size': len(self.deck),
             'pending_draw': self.pending_draw,
             'direction': self.direction,
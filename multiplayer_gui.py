@@ -3,7 +3,7 @@
 
 import pygame, sys, time
 from multiplayer_game import MultiplayerGame
-from uno_game import Color, CardType
+from uno_game import Color, CardType, COLOR_RGB
 
 pygame.init()
 
@@ -11,6 +11,12 @@ pygame.init()
 CARD_WIDTH = 55
 CARD_HEIGHT = 90
 CARD_RADIUS = 8
+# color key for the rounded corners (no card pixel uses it)
+CARD_KEY = (255, 0, 255)
+
+# center label for non-number cards
+CARD_TYPE_LABELS = {CardType.SKIP:"Skip", CardType.REVERSE:"Rev", CardType.DRAW_TWO:"+2",
+                    CardType.WILD:"Wild", CardType.WILD_DRAW_FOUR:"+4"}
 
 WINDOW_WIDTH = 1400
 WINDOW_HEIGHT = 900
@@ -29,6 +35,10 @@ class MultiplayerGUI:
         self.num_players = num_players
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption(f"UNO - Multiplayer ({num_players})")
+        # Only queue the events this screen handles (mouse motion, keys, etc. are dropped by SDL)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN,
+                                  pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 24)
         self.small = pygame.font.Font(None, 18)
@@ -38,6 +48,9 @@ class MultiplayerGUI:
         self.choosing_color = False
         self.notification = ""
         self.notification_t = 0
+        # nothing moves between clicks; run() only draws when this is set
+        # or a notification is counting down
+        self._dirty = True
 
         # corner positions
         self.padding = 20
@@ -52,30 +65,55 @@ class MultiplayerGUI:
         # deck rect (left of discard)
         self.deck_rect = pygame.Rect(self.discard_center[0] - CARD_WIDTH - 40, self.discard_center[1], CARD_WIDTH, CARD_HEIGHT)
 
+        # one pre-drawn Surface per distinct card face
+        self._card_surfs = {}
+        # (start_x, y, spacing) per (player, hand size), see compute_hand_layout()
+        self._layouts = {}
+        # game over dimming layer, allocated once
+        self._game_over_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._game_over_overlay.fill((0,0,0))
+        self._game_over_overlay.set_alpha(200)
+
     def show_notification(self, txt, dur=120):
         self.notification = txt
         self.notification_t = dur
 
+    def get_card_surface(self, card, face_up=True):
+        key = (card.color, card.card_type, card.number) if face_up else None
+        surf = self._card_surfs.get(key)
+        if surf is None:
+            surf = pygame.Surface((CARD_WIDTH, CARD_HEIGHT)).convert()
+            surf.fill(CARD_KEY)
+            # card outer
+            pygame.draw.rect(surf, WHITE if face_up else (180,180,180), (0, 0, CARD_WIDTH, CARD_HEIGHT), border_radius=CARD_RADIUS)
+            pygame.draw.rect(surf, BLACK, (0, 0, CARD_WIDTH, CARD_HEIGHT), width=2, border_radius=CARD_RADIUS)
+            if face_up:
+                inner = COLOR_RGB[card.color.value]
+                pygame.draw.rect(surf, inner, (6, 8, CARD_WIDTH-12, CARD_HEIGHT-16), border_radius=6)
+                if card.card_type == CardType.NUMBER:
+                    text = str(card.number)
+                else:
+                    text = CARD_TYPE_LABELS.get(card.card_type, "?")
+                txt = self.font.render(text, True, WHITE)
+                surf.blit(txt, (CARD_WIDTH//2 - txt.get_width()//2, CARD_HEIGHT//2 - txt.get_height()//2))
+            surf.set_colorkey(CARD_KEY, pygame.RLEACCEL)
+            self._card_surfs[key] = surf
+        return surf
+
     def draw_card(self, card, x, y, face_up=True):
-        # card outer
-        pygame.draw.rect(self.screen, WHITE if face_up else (180,180,180), (x, y, CARD_WIDTH, CARD_HEIGHT), border_radius=CARD_RADIUS)
-        pygame.draw.rect(self.screen, BLACK, (x, y, CARD_WIDTH, CARD_HEIGHT), width=2, border_radius=CARD_RADIUS)
-        if face_up:
-            inner = card.get_color_rgb()
-            pygame.draw.rect(self.screen, inner, (x+6, y+8, CARD_WIDTH-12, CARD_HEIGHT-16), border_radius=6)
-            if card.card_type == CardType.NUMBER:
-                text = str(card.number)
-            else:
-                mapping = {CardType.SKIP:"Skip", CardType.REVERSE:"Rev", CardType.DRAW_TWO:"+2",
-                           CardType.WILD:"Wild", CardType.WILD_DRAW_FOUR:"+4"}
-                text = mapping.get(card.card_type, "?")
-            txt = self.font.render(text, True, WHITE)
-            self.screen.blit(txt, (x + CARD_WIDTH//2 - txt.get_width()//2, y + CARD_HEIGHT//2 - txt.get_height()//2))
+        self.screen.blit(self.get_card_surface(card, face_up), (x, y))
 
     def compute_hand_layout(self, player_index):
+        # the layout only depends on the corner and the hand size
+        n = len(self.game.hands[player_index])
+        key = (player_index, n)
+        layout = self._layouts.get(key)
+        if layout is None:
+            layout = self._layouts[key] = self._hand_layout(player_index, n)
+        return layout
+
+    def _hand_layout(self, player_index, n):
         # determine corner coordinates and compute spacing that fits
-        hand = self.game.hands[player_index]
-        n = len(hand)
         # max cards to reserve visually is 12; spacing will shrink to fit
         max_space = 6 * CARD_WIDTH
         # compute available width per corner
@@ -115,46 +153,46 @@ class MultiplayerGUI:
         cur = self.game.current_player
         # compute rects for cur player's hand
         start_x, y, spacing = self.compute_hand_layout(cur)
-        rects = []
-        for i in range(len(self.game.hands[cur])):
-            x = start_x + i * spacing
-            rects.append(pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT))
-
-        for i, r in enumerate(rects):
-            if r.collidepoint((mx,my)):
-                card = self.game.hands[cur][i]
-                # if playable
-                if card.can_play_on(self.game.get_top_card(), self.game.current_color):
-                    if card.color == Color.WILD:
-                        chosen = self.game.choose_color_for_wild(cur)
-                        self.game.play_card(cur, i, chosen)
-                        self.show_notification(f"P{cur+1} played {card} -> {chosen.name}", 90)
-                    else:
-                        self.game.play_card(cur, i)
-                        self.show_notification(f"P{cur+1} played {card}", 90)
-                    # after play switch turn (engine handles skip/pending_draw)
-                    if not self.game.game_over:
-                        self.game.switch_turn()
+        n = len(self.game.hands[cur])
+        rects = [pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT)
+                 for x in range(start_x, start_x + n * spacing, spacing)]
+
+        # cards overlap when the hand is squeezed; keep the leftmost hit like before
+        i = pygame.Rect(mx, my, 1, 1).collidelist(rects)
+        if i != -1:
+            card = self.game.hands[cur][i]
+            # if playable
+            if card.can_play_on(self.game.get_top_card(), self.game.current_color):
+                if card.color == Color.WILD:
+                    chosen = self.game.choose_color_for_wild(cur)
+                    self.game.play_card(cur, i, chosen)
+                    self.show_notification(f"P{cur+1} played {card} -> {chosen.name}", 90)
                 else:
-                    # invalid play: if no valid cards allow draw
-                    valid = self.game.get_valid_cards(cur)
-                    if not valid:
-                        drawn = self.game.draw_card(cur)
-                        if drawn and drawn.can_play_on(self.game.get_top_card(), self.game.current_color):
-                            # auto-play drawn card
-                            if drawn.color == Color.WILD:
-                                chosen = self.game.choose_color_for_wild(cur)
-                                self.game.play_card(cur, len(self.game.hands[cur]) - 1, chosen)
-                                self.show_notification(f"P{cur+1} drew and played {drawn}", 90)
-                            else:
-                                self.game.play_card(cur, len(self.game.hands[cur]) - 1)
-                                self.show_notification(f"P{cur+1} drew and played {drawn}", 90)
+                    self.game.play_card(cur, i)
+                    self.show_notification(f"P{cur+1} played {card}", 90)
+                # after play switch turn (engine handles skip/pending_draw)
+                if not self.game.game_over:
+                    self.game.switch_turn()
+            else:
+                # invalid play: if no valid cards allow draw
+                valid = self.game.get_valid_cards(cur)
+                if not valid:
+                    drawn = self.game.draw_card(cur)
+                    if drawn and drawn.can_play_on(self.game.get_top_card(), self.game.current_color):
+                        # auto-play drawn card
+                        if drawn.color == Color.WILD:
+                            chosen = self.game.choose_color_for_wild(cur)
+                            self.game.play_card(cur, len(self.game.hands[cur]) - 1, chosen)
+                            self.show_notification(f"P{cur+1} drew and played {drawn}", 90)
                         else:
-                            self.show_notification("Drew a card; turn ends", 60)
-                            self.game.switch_turn()
+                            self.game.play_card(cur, len(self.game.hands[cur]) - 1)
+                            self.show_notification(f"P{cur+1} drew and played {drawn}", 90)
                     else:
-                        self.show_notification("Invalid card!", 60)
-                return
+                        self.show_notification("Drew a card; turn ends", 60)
+                        self.game.switch_turn()
+                else:
+                    self.show_notification("Invalid card!", 60)
+            return
 
         # deck clicked
         if self.deck_rect.collidepoint((mx,my)):
@@ -192,15 +230,15 @@ class MultiplayerGUI:
         deck_txt = self.small.render(f"{len(self.game.deck)}", True, WHITE)
         self.screen.blit(deck_txt, (self.deck_rect.x + 6, self.deck_rect.y + CARD_HEIGHT + 6))
 
-        # draw each player's hand in corner
+        # draw each player's hand in corner; all cards go out in one blits() call
+        card_blits = []
         for p in range(self.num_players):
             if p >= self.num_players:
                 continue
             start_x, y, spacing = self.compute_hand_layout(p)
             hand = self.game.hands[p]
-            for i, card in enumerate(hand):
-                x = start_x + i * spacing
-                self.draw_card(card, x, y, face_up=True)
+            xs = range(start_x, start_x + len(hand) * spacing, spacing)
+            card_blits.extend([(self.get_card_surface(card), (x, y)) for x, card in zip(xs, hand)])
             # player label and count
             lbl = f"P{p+1} ({len(hand)})"
             label_surf = self.font.render(lbl, True, WHITE)
@@ -214,6 +252,7 @@ class MultiplayerGUI:
                     self.screen.blit(label_surf, (start_x, y - 22))
                 else:
                     self.screen.blit(label_surf, (start_x, y + CARD_HEIGHT + 8))
+        self.screen.blits(card_blits, doreturn=False)
 
         # turn indicator top center
         turn_txt = self.font.render(f"P{self.game.current_player + 1}'s turn", True, YELLOW)
@@ -227,13 +266,13 @@ class MultiplayerGUI:
             pygame.draw.rect(self.screen, BLACK, box, width=2, border_radius=6)
             self.screen.blit(n, (box.x+10, box.y+5))
             self.notification_t -= 1
+            if self.notification_t == 0:
+                # one more frame to clear it
+                self._dirty = True
 
         # game over overlay
         if self.game.game_over:
-            ov = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            ov.set_alpha(200)
-            ov.fill((0,0,0))
-            self.screen.blit(ov, (0,0))
+            self.screen.blit(self._game_over_overlay, (0,0))
             winner = self.game.winner
             txt = self.font.render(f"Player {winner+1} wins!", True, (255,255,255))
             self.screen.blit(txt, (WINDOW_WIDTH//2 - txt.get_width()//2, WINDOW_HEIGHT//2 - 20))
@@ -243,16 +282,25 @@ class MultiplayerGUI:
     def run(self):
         running = True
         while running:
-            self.clock.tick(FPS)
-            for ev in pygame.event.get():
+            if self._dirty or self.notification_t > 0:
+                self.clock.tick(FPS)
+                events = pygame.event.get()
+            else:
+                # sleep until the next click (or expose/quit)
+                events = [pygame.event.wait()] + pygame.event.get()
+            for ev in events:
+                # clicks change the game; expose needs the frame again
+                self._dirty = True
                 if ev.type == pygame.QUIT:
                     running = False
                 if ev.type == pygame.MOUSEBUTTONDOWN:
-                    mx,my = pygame.mouse.get_pos()
+                    mx,my = ev.pos
                     # only allow clicks when it's a human player's turn
                     self.handle_click(mx,my)
             # draw
-            self.draw()
+            if self._dirty or self.notification_t > 0:
+                self._dirty = False
+                self.draw()
         pygame.quit()
         sys.exit()
 
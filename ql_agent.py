@@ -1,13 +1,62 @@
 # This file contains the RL agent (Q-Learning agent) PLUS two simple opponents (Random and Heuristic) that the GUI expects.
 
+import os
 import random
 import pickle
-from collections import defaultdict, deque
+import tempfile
+import numpy as np
+from collections import deque
 from typing import Optional
 
+from uno_game import Card, CardType, Color
+
 # ---------------------------------------------------------
 # Q-Learning Agent
 # ---------------------------------------------------------
+# Q rows start with room for this many actions (hand indices) and grow on demand
+Q_ROW_SIZE = 16
+
+# save_model writes a .npz (zip) archive; older saves are pickles
+MODEL_FILE = "uno_agent.npz"
+LEGACY_MODEL_FILE = "uno_agent.pkl"
+_NPZ_MAGIC = b"PK\x03\x04"
+
+def _pack_state_key(color_counts, top_color, top_type, top_number, current_color, hand_size, opponent_count):
+    """
+    Bit-pack the state fields into one int (the q_table key).
+    Counts get 7 bits each (a deck has 108 cards); the enum/number fields are
+    shifted by +1 so their -1 "missing" marker packs as 0.
+    """
+    key = 0
+    for count in color_counts:
+        key = (key << 7) | count
+    return _pack_state_fields(key, top_color, top_type, top_number, current_color, hand_size, opponent_count)
+
+# Adding _COLOR_COUNT_BITS[color.value] once per card builds the packed color-count
+# field of _pack_state_key directly (no count can carry into the next 7 bits)
+_COLOR_COUNT_BITS = tuple(1 << (7 * (4 - v)) for v in range(5))
+
+def _pack_state_fields(key, top_color, top_type, top_number, current_color, hand_size, opponent_count):
+    """_pack_state_key with the color counts already packed into key."""
+    key = (key << 3) | (top_color + 1)
+    key = (key << 3) | (top_type + 1)
+    key = (key << 4) | (top_number + 1)
+    key = (key << 3) | (current_color + 1)
+    key = (key << 7) | hand_size
+    return (key << 7) | opponent_count
+
+def _greedy_action(row, valid_actions):
+    """
+    Argmax of row over valid_actions.
+    Ties are broken uniformly at random, in valid_actions order.
+    """
+    # scalar row.item() reads, as in _update_from_key: for a handful of actions
+    # they beat a numpy gather + compare
+    qs = list(map(row.item, valid_actions))
+    best = max(qs)
+    return random.choice([a for a, q in zip(valid_actions, qs) if q == best])
+
+
 class QLearningAgent:
     def __init__(self, alpha = 0.1, gamma= 0.9, epsilon= 0.2, name= "QLearning", epsilon_min = 0.05, epsilon_decay = 0.9995):
         """
@@ -17,7 +66,8 @@ class QLearningAgent:
         name: friendly label (used in GUI)
         epsilon_min, epsilon_decay: simple adaptive epsilon schedule
         """
-        self.q_table = defaultdict(lambda: defaultdict(float))
+        # packed state key -> float32 row of Q-values indexed by action (see _row)
+        self.q_table = {}
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
@@ -29,13 +79,14 @@ class QLearningAgent:
         self.games_played = 0
         self.games_won = 0
         self.rewards_history = deque(maxlen=500)  # recent episode total rewards
+        self._reward_sum = 0.0  # running sum of rewards_history for get_average_reward
 
     # -----------------------
     # State handling
     # -----------------------
     def state_to_key(self, state):
         """
-        Create a compact, hashable state key from the state dictionary.
+        Create a compact integer state key from the state dictionary.
         This function accepts multiple possible key names
         produced by different versions of UnoGame.
         Expected fields used (if present):
@@ -47,39 +98,57 @@ class QLearningAgent:
         """
         hand = state.get('hand', [])
         top_card = state.get('top_card')
-
-        # safe color counts (color.value assumed 0..4)
-        color_counts = [0] * 5
+        current_color = state.get('current_color')
+
+        # Enum members keep their value in the plain `_value_` attribute; reading it
+        # skips the `.value` descriptor, which is the bulk of this per-step cost.
+        # safe color counts (color.value assumed 0..4), tallied straight into
+        # their packed 7-bit fields
+        bits = _COLOR_COUNT_BITS
+        color_key = 0
         for card in hand:
             try:
-                color_counts[card.color.value] += 1
+                color_key += bits[card.color._value_]
             except Exception:
                 # fallback if not enum-like
                 pass
 
-        # robust lookups for opponent/player counts
-        opponent_count = state.get('player_card_count',
-                          state.get('opponent_card_count',
-                          state.get('opponent_card_count', None)))
+        # robust lookups for opponent/player counts (the fallbacks are only looked up
+        # when the preferred key is missing)
+        if 'player_card_count' in state:
+            opponent_count = state['player_card_count']
+        else:
+            opponent_count = state.get('opponent_card_count')
         if opponent_count is None:
             opponent_count = state.get('my_card_count', len(hand))  # fallback
 
-        # top card info (defensive)
-        if top_card is None:
-            top_color = -1
-            top_type = -1
-            top_number = -1
+        if (type(top_card) is Card and type(current_color) is Color
+                and type(top_card.color) is Color and type(top_card.card_type) is CardType):
+            # the states the engines build: read the fields directly
+            top_color = top_card.color._value_
+            top_type = top_card.card_type._value_
+            top_number = top_card.number
+            current = current_color._value_
         else:
-            top_color = getattr(top_card.color, 'value', -1)
-            top_type = getattr(top_card.card_type, 'value', -1)
-            top_number = getattr(top_card, 'number', -1) if getattr(top_card, 'number', None) is not None else -1
+            # top card info (defensive)
+            if top_card is None:
+                top_color = -1
+                top_type = -1
+                top_number = -1
+            else:
+                top_color = getattr(top_card.color, '_value_', -1)
+                top_type = getattr(top_card.card_type, '_value_', -1)
+                top_number = getattr(top_card, 'number', None)
+            current = getattr(current_color, '_value_', -1)
+        if top_number is None:
+            top_number = -1
 
-        state_key = (
-            tuple(color_counts),
+        state_key = _pack_state_fields(
+            color_key,
             top_color,
             top_type,
             top_number,
-            getattr(state.get('current_color'), 'value', -1),
+            current,
             len(hand),
             int(opponent_count)
         )
@@ -88,53 +157,111 @@ class QLearningAgent:
     # -----------------------
     # Q interface
     # -----------------------
+    def _row(self, state_key, actions):
+        """
+        Q-value row for state_key, long enough to index every action in `actions`.
+        Missing states start out as a zero row.
+        """
+        size = max(actions) + 1
+        row = self.q_table.get(state_key)
+        if row is None:
+            row = self.q_table[state_key] = np.zeros(max(size, Q_ROW_SIZE), dtype=np.float32)
+        elif len(row) < size:
+            row = self.q_table[state_key] = np.concatenate((row, np.zeros(size - len(row), dtype=np.float32)))
+        return row
+
+    def _peek_row(self, state_key, actions):
+        """
+        Read-only counterpart of _row: unseen states (or actions past the end of a
+        short row) read as zeros without being added to q_table, so only updates
+        grow the table.
+        """
+        size = max(actions) + 1
+        row = self.q_table.get(state_key)
+        if row is None:
+            return np.zeros(max(size, Q_ROW_SIZE), dtype=np.float32)
+        if len(row) < size:
+            return np.concatenate((row, np.zeros(size - len(row), dtype=np.float32)))
+        return row
+
     def get_q_value(self, state, action):
         state_key = self.state_to_key(state)
-        return self.q_table[state_key][action]
+        return float(self._peek_row(state_key, (action,))[action])
+
+    def _pick_without_q(self, valid_actions):
+        """
+        The epsilon-greedy steps that don't need Q-values: a forced move or an
+        exploration pick. Returns None when the greedy pick has to be made.
+        """
+        if len(valid_actions) == 1:
+            # The explore draw is discarded: a forced move makes the same two RNG
+            # calls as either full branch (random(), then choice()), so seeded
+            # training runs are unchanged while the Q lookup is skipped.
+            random.random()
+            return random.choice(valid_actions)
+        if random.random() < self.epsilon:
+            return random.choice(valid_actions)
+        return None
 
     def choose_action(self, state, valid_actions):
         """Epsilon-greedy. valid_actions is a list of indices into hand"""
         if not valid_actions:
             return None
-
-        # explore
-        if random.random() < self.epsilon:
-            return random.choice(valid_actions)
+        action = self._pick_without_q(valid_actions)
+        if action is not None:
+            return action
 
         state_key = self.state_to_key(state)
-        # ensure all valid actions exist in table
-        q_values = {a: self.q_table[state_key][a] for a in valid_actions}
-        max_q = max(q_values.values())
-        best = [a for a, q in q_values.items() if q == max_q]
-        return random.choice(best)
+        return _greedy_action(self._peek_row(state_key, valid_actions), valid_actions)
+
+    def _choose_from_key(self, state_key, valid_actions):
+        """choose_action for a caller that already has state_to_key(state)."""
+        if not valid_actions:
+            return None
+        action = self._pick_without_q(valid_actions)
+        if action is not None:
+            return action
+        return _greedy_action(self._peek_row(state_key, valid_actions), valid_actions)
 
     def update_q_value(self, state, action, reward, next_state, next_valid_actions, done):
-        state_key = self.state_to_key(state)
-        current_q = self.q_table[state_key][action]
+        self._update_from_key(self.state_to_key(state), action, reward, next_state, next_valid_actions, done)
+
+    def _update_from_key(self, state_key, action, reward, next_state, next_valid_actions, done):
+        """update_q_value for a caller that already has state_to_key(state)."""
+        row = self._row(state_key, (action,))
+        # scalar row.item() reads: for a handful of actions these beat gathering a
+        # numpy sub-array just to take its max
+        current_q = row.item(action)
 
         if done or next_state is None:
             max_next_q = 0
         else:
             next_key = self.state_to_key(next_state)
             if next_valid_actions:
-                max_next_q = max([self.q_table[next_key][a] for a in next_valid_actions])
+                next_row = self._peek_row(next_key, next_valid_actions)
+                max_next_q = max(map(next_row.item, next_valid_actions))
             else:
                 max_next_q = 0
 
-        new_q = current_q + self.alpha * (reward + self.gamma * max_next_q - current_q)
-        self.q_table[state_key][action] = new_q
+        row[action] = current_q + self.alpha * (reward + self.gamma * max_next_q - current_q)
 
     def get_action_confidences(self, state, valid_actions):
         if not valid_actions:
             return {}
         state_key = self.state_to_key(state)
-        return {a: self.q_table[state_key][a] for a in valid_actions}
+        row = self._peek_row(state_key, valid_actions)
+        return {a: float(row[a]) for a in valid_actions}
 
     # -----------------------
     # Stats helpers (used by GUI)
     # -----------------------
     def record_episode_reward(self, total_reward):
-        self.rewards_history.append(total_reward)
+        history = self.rewards_history
+        if len(history) == history.maxlen:
+            # the append below evicts the oldest reward
+            self._reward_sum -= history[0]
+        history.append(total_reward)
+        self._reward_sum += total_reward
 
     def get_win_rate(self):
         if self.games_played == 0:
@@ -144,7 +271,7 @@ class QLearningAgent:
     def get_average_reward(self):
         if not self.rewards_history:
             return 0.0
-        return sum(self.rewards_history) / len(self.rewards_history)
+        return self._reward_sum / len(self.rewards_history)
 
     def get_adaptive_epsilon(self):
         return self.epsilon
@@ -159,35 +286,62 @@ class QLearningAgent:
     # -----------------------
     # Persistence
     # -----------------------
-    def save_model(self, filename="uno_agent.pkl"):
-        # Convert nested defaultdict to normal dicts for pickling
-        serial = {}
-        for s, inner in self.q_table.items():
-            serial[s] = dict(inner)
-        payload = {
-            'q_table': serial,
-            'games_played': self.games_played,
-            'games_won': self.games_won,
-            'rewards_history': list(self.rewards_history),
-            'epsilon': self.epsilon
-        }
-        with open(filename, 'wb') as f:
-            pickle.dump(payload, f)
+    def save_model(self, filename=MODEL_FILE):
+        """
+        Save as a compressed NumPy archive: the packed state keys as one int64
+        vector and their rows as one zero-padded float32 matrix. Much smaller and
+        faster to write/read than pickling one array per state.
+        The archive is written to a temp file next to filename and then moved
+        over it, so an interrupted save never leaves a truncated model behind.
+        """
+        keys = np.fromiter(self.q_table.keys(), dtype=np.int64, count=len(self.q_table))
+        width = max((len(row) for row in self.q_table.values()), default=Q_ROW_SIZE)
+        rows = np.zeros((len(keys), width), dtype=np.float32)
+        for i, row in enumerate(self.q_table.values()):
+            rows[i, :len(row)] = row
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)),
+                                        prefix=".uno_agent-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(
+                    f,
+                    keys=keys,
+                    rows=rows,
+                    games_played=self.games_played,
+                    games_won=self.games_won,
+                    rewards_history=np.array(self.rewards_history, dtype=np.float64),
+                    epsilon=self.epsilon
+                )
+            os.replace(tmp_name, filename)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
         print(f"[QLearningAgent] Model saved to {filename}")
 
-    def load_model(self, filename="uno_agent.pkl"):
+    def load_model(self, filename=MODEL_FILE, legacy_filename=LEGACY_MODEL_FILE):
+        """
+        Load filename, or the older pickle save legacy_filename when filename
+        doesn't exist yet. Either format is recognised by its first bytes.
+        """
+        if legacy_filename and not os.path.exists(filename) and os.path.exists(legacy_filename):
+            filename = legacy_filename
         try:
             with open(filename, 'rb') as f:
+                if f.read(4) == _NPZ_MAGIC:
+                    f.seek(0)
+                    self._load_npz(f)
+                    print(f"[QLearningAgent] Model loaded from {filename}")
+                    return True
+                f.seek(0)
                 data = pickle.load(f)
-            # rebuild nested defaultdict
-            new_q = defaultdict(lambda: defaultdict(float))
-            for s, inner in data.get('q_table', {}).items():
-                # inner is a dict mapping actions to floats
-                new_q[s] = defaultdict(float, inner)
-            self.q_table = new_q
+            if data.get('q_format') == 'packed':
+                self.q_table = data['q_table']
+            else:
+                self.q_table = self._convert_legacy_q_table(data.get('q_table', {}))
             self.games_played = data.get('games_played', 0)
             self.games_won = data.get('games_won', 0)
             self.rewards_history = deque(data.get('rewards_history', []), maxlen=500)
+            self._reward_sum = float(sum(self.rewards_history))
             self.epsilon = data.get('epsilon', self.epsilon)
             print(f"[QLearningAgent] Model loaded from {filename}")
             return True
@@ -195,6 +349,34 @@ class QLearningAgent:
             print(f"[QLearningAgent] No saved model found at {filename}")
             return False
 
+    def _load_npz(self, f):
+        with np.load(f) as data:
+            # each row is a view into the one loaded matrix, like _convert_legacy_q_table
+            self.q_table = dict(zip(data['keys'].tolist(), data['rows']))
+            self.games_played = int(data['games_played'])
+            self.games_won = int(data['games_won'])
+            self.rewards_history = deque(data['rewards_history'].tolist(), maxlen=500)
+            self._reward_sum = float(sum(self.rewards_history))
+            self.epsilon = float(data['epsilon'])
+
+    @staticmethod
+    def _convert_legacy_q_table(legacy):
+        """
+        Convert an older save (state tuple -> {action: q}) to packed keys and
+        float32 rows.
+        """
+        keys, state_idx, actions, values = [], [], [], []
+        for i, (s, inner) in enumerate(legacy.items()):
+            keys.append(_pack_state_key(*s))
+            state_idx.extend([i] * len(inner))
+            actions.extend(inner)
+            values.extend(inner.values())
+        # fill one (states x actions) block in a single scatter; each row is a view into it
+        width = max(max(actions, default=0) + 1, Q_ROW_SIZE)
+        rows = np.zeros((len(keys), width), dtype=np.float32)
+        rows[state_idx, actions] = values
+        return dict(zip(keys, rows))
+
 # ---------------------------------------------------------
 # Simple opponent agents (as GUI expects)
 # ---------------------------------------------------------
@@ -222,6 +404,18 @@ class RandomAgent:
     def get_adaptive_epsilon(self):
         return 0.0
 
+# Heuristic score per CardType value (NUMBER, SKIP, REVERSE, DRAW_TWO, WILD, WILD_DRAW_FOUR);
+# number cards additionally score their number
+_HEURISTIC_TYPE_SCORE_LIST = (0, 20, 0, 30, 50, 50)
+
+def _heuristic_score(card):
+    """HeuristicAgent's score for one Card: a table lookup by CardType value."""
+    type_value = card.card_type._value_
+    score = _HEURISTIC_TYPE_SCORE_LIST[type_value]
+    if type_value == 0 and card.number is not None:
+        score += card.number
+    return score
+
 class HeuristicAgent:
     """
     Very small heuristic: prefers action cards, wilds, then highest number.
@@ -236,22 +430,16 @@ class HeuristicAgent:
         if not valid_actions:
             return None
         hand = state.get('hand', [])
-        # prefer draw+skip+wild in that order
+        # prefer draw+skip+wild in that order (same scores as _heuristic_score, inlined)
+        type_scores = _HEURISTIC_TYPE_SCORE_LIST
         best_score = None
         best_action = None
         for a in valid_actions:
             card = hand[a]
-            score = 0
-            if card.card_type.name in ("WILD_DRAW_FOUR", "WILD"):
-                score += 50
-            if card.card_type.name == "DRAW_TWO":
-                score += 30
-            if card.card_type.name == "SKIP":
-                score += 20
-            if card.card_type == getattr(card, 'card_type'):
-                pass
+            type_value = card.card_type._value_
+            score = type_scores[type_value]
             # number preference
-            if card.card_type.name == "NUMBER" and getattr(card, 'number', None) is not None:
+            if type_value == 0 and card.number is not None:
                 score += card.number
             if best_score is None or score > best_score:
                 best_score = score
@@ -264,21 +452,7 @@ class HeuristicAgent:
         # return small heuristic confidences (bigger for higher heuristic score)
         confidences = {}
         hand = state.get('hand', [])
-        scores = []
-        for a in valid_actions:
-            card = hand[a]
-            score = 0
-            if card.card_type.name in ("WILD_DRAW_FOUR", "WILD"):
-                score += 50
-            if card.card_type.name == "DRAW_TWO":
-                score += 30
-            if card.card_type.name == "SKIP":
-                score += 20
-            if card.card_type == getattr(card, 'card_type'):
-                pass
-            if card.card_type.name == "NUMBER" and getattr(card, 'number', None) is not None:
-                score += card.number
-            scores.append((a, score))
+        scores = [(a, _heuristic_score(hand[a])) for a in valid_actions]
         max_score = max(s for _, s in scores) or 1.0
         for a, s in scores:
             confidences[a] = s / max_score
@@ -310,36 +484,45 @@ def train_agent(agent: Optional[QLearningAgent] = None,
         'heuristic': HeuristicAgent()
     }
 
+    # the get_state_for_ai signature can't change mid-training: check it once, not twice per step
+    has_perspective = 'perspective_player' in UnoGame.get_state_for_ai.__code__.co_varnames
+
     for episode in range(num_episodes):
         game = UnoGame()
         total_rewards = [0.0, 0.0]  # reward per player this episode
         # we will treat agent as player 1 (AI) for consistency with earlier design
         # if opponent_type == 'self' the agent will control both players (simpler)
+
+        # pick the acting agent for each player; fixed for the whole episode
+        if opponent_type == 'self':
+            acting_agents = (agent, agent)
+        elif opponent_type == 'random':
+            acting_agents = (opponents['random'],) * 2
+        elif opponent_type == 'heuristic':
+            acting_agents = (opponents['heuristic'],) * 2
+        elif opponent_type == 'mixed':
+            # mix behavior: player 1 is our agent, player 0 alternates random/heuristic
+            acting_agents = (opponents['random'] if (episode % 2 == 0) else opponents['heuristic'], agent)
+        else:
+            acting_agents = (opponents.get(opponent_type, opponents['random']),) * 2
+
         while not game.game_over:
             current_player = game.current_player
             # create state from current player's perspective consistent with earlier code
-            state = game.get_state_for_ai(perspective_player=current_player) if 'perspective_player' in game.get_state_for_ai.__code__.co_varnames else game.get_state_for_ai()
+            state = game.get_state_for_ai(perspective_player=current_player, include_stats=False) if has_perspective else game.get_state_for_ai()
             hand = game.ai_hand if current_player == 1 else game.player_hand
             valid_actions = game.get_valid_cards(hand)
+            acting_agent = acting_agents[current_player]
 
-            # pick acting agent
-            if opponent_type == 'self':
-                acting_agent = agent
-            elif opponent_type == 'random':
-                acting_agent = opponents['random']
-            elif opponent_type == 'heuristic':
-                acting_agent = opponents['heuristic']
-            elif opponent_type == 'mixed':
-                # mix behavior: if current_player is 1 -> our agent, else alternate random/heuristic
-                if current_player == 1:
-                    acting_agent = agent
-                else:
-                    acting_agent = opponents['random'] if (episode % 2 == 0) else opponents['heuristic']
-            else:
-                acting_agent = opponents.get(opponent_type, opponents['random'])
+            # the agent's own turns need the state key for the Q update below, so compute
+            # it once here and reuse it for the action choice as well
+            state_key = agent.state_to_key(state) if current_player == 1 else None
 
             if valid_actions:
-                action = acting_agent.choose_action(state, valid_actions)
+                if acting_agent is agent and state_key is not None:
+                    action = agent._choose_from_key(state_key, valid_actions)
+                else:
+                    action = acting_agent.choose_action(state, valid_actions)
                 success = game.play_card(current_player, action)
                 if success:
                     reward = 0.1  # small reward for playing a card
@@ -360,10 +543,10 @@ def train_agent(agent: Optional[QLearningAgent] = None,
                 # update Q for agent's previous chosen action if applicable
                 # (we need to store previous state/action — to keep simple, do immediate update)
                 # obtain next state and next_valid for update
-                next_state = game.get_state_for_ai(perspective_player=1) if 'perspective_player' in game.get_state_for_ai.__code__.co_varnames else game.get_state_for_ai()
+                next_state = game.get_state_for_ai(perspective_player=1, include_stats=False) if has_perspective else game.get_state_for_ai()
                 next_valid = game.get_valid_cards(game.ai_hand)
                 if action is not None:
-                    agent.update_q_value(state, action, reward, next_state, next_valid, game.game_over)
+                    agent._update_from_key(state_key, action, reward, next_state, next_valid, game.game_over)
             else:
                 total_rewards[0] += reward
 
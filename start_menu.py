@@ -19,11 +19,16 @@ GREEN = (34,139,34)
 BLUE = (70,130,180)
 ORANGE = (255,140,0)
 RED = (200,50,50)
+# color key for the corners outside a button's rounded rect (no button pixel uses it)
+BUTTON_KEY = (255,0,255)
 
 class StartMenu:
     def __init__(self):
         self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
         pygame.display.set_caption("SMART UNO - RL AGENT")
+        # Only queue the events the menus handle (mouse motion, keys, etc. are dropped by SDL)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN])
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 50)
         self.small_font = pygame.font.Font(None, 30)
@@ -33,12 +38,28 @@ class StartMenu:
         self.btn_ai_vs_ai = pygame.Rect(WINDOW_WIDTH//2 - 150, 290, 300, 60)
         self.btn_multiplayer = pygame.Rect(WINDOW_WIDTH//2 - 150, 380, 300, 60)
 
-    def draw_button(self, rect, text, color):
-        pygame.draw.rect(self.screen, color, rect, border_radius=10)
-        pygame.draw.rect(self.screen, BLACK, rect, width=3, border_radius=10)
+        # Finished button Surfaces keyed by (size, text, color), see draw_button()
+        self._button_surfs = {}
+
+    def _build_button_surf(self, size, text, color):
+        """Fill, border and label of one button; the rounded corners are keyed out."""
+        w, h = size
+        surf = pygame.Surface(size).convert()
+        surf.fill(BUTTON_KEY)
+        pygame.draw.rect(surf, color, (0, 0, w, h), border_radius=10)
+        pygame.draw.rect(surf, BLACK, (0, 0, w, h), width=3, border_radius=10)
         txt = self.font.render(text, True, WHITE)
-        self.screen.blit(txt, (rect.centerx - txt.get_width()//2,
-                               rect.centery - txt.get_height()//2))
+        surf.blit(txt, (w//2 - txt.get_width()//2,
+                        h//2 - txt.get_height()//2))
+        surf.set_colorkey(BUTTON_KEY, pygame.RLEACCEL)
+        return surf
+
+    def draw_button(self, rect, text, color):
+        key = (rect.size, text, color)
+        surf = self._button_surfs.get(key)
+        if surf is None:
+            surf = self._button_surfs[key] = self._build_button_surf(rect.size, text, color)
+        self.screen.blit(surf, rect.topleft)
 
     def ask_player_count(self):
         """Popup selection for 2–4 players (for multiplayer mode)."""
@@ -70,7 +91,7 @@ class StartMenu:
                     sys.exit()
 
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = event.pos
                     for rect, num in count_buttons:
                         if rect.collidepoint((mx,my)):
                             return num
@@ -98,7 +119,7 @@ class StartMenu:
                     sys.exit()
 
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mx, my = pygame.mouse.get_pos()
+                    mx, my = event.pos
 
                     # PLAYER VS AI — run your existing UNO GUI
                     if self.btn_player_vs_ai.collidepoint((mx,my)):
@@ -12,19 +12,24 @@ Features:
 """
 
 import random
-from enum import Enum 
+from collections import deque
+from enum import IntEnum
 
 # --- Enums to model card properties ---
 
-class Color(Enum):
-    """Color enum for UNO cards. WILD is used for wild cards (no color)."""
+class Color(IntEnum):
+    """Color enum for UNO cards. WILD is used for wild cards (no color).
+
+    IntEnum so members hash and compare as plain ints (Enum hashes by name in
+    Python); hot paths still test members with `is`.
+    """
     RED = 0
     BLUE = 1
     GREEN = 2
     YELLOW = 3
     WILD = 4
 
-class CardType(Enum):
+class CardType(IntEnum):
     """Types of UNO cards. NUMBER uses 'number' field. Action cards ignore number."""
     NUMBER = 0
     SKIP = 1
@@ -33,6 +38,19 @@ class CardType(Enum):
     WILD = 4
     WILD_DRAW_FOUR = 5
 
+# Card UI colors indexed by Color.value (RED, BLUE, GREEN, YELLOW, WILD)
+COLOR_RGB = ((220, 20, 60), (30, 144, 255), (50, 205, 50), (255, 215, 0), (50, 50, 50))
+
+# Card types that may be stacked onto a pending draw penalty
+STACKABLE_TYPES = frozenset((CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR))
+
+# Non-number card types, tracked in last_action_cards
+ACTION_TYPES = frozenset((CardType.SKIP, CardType.REVERSE, CardType.DRAW_TWO,
+                          CardType.WILD, CardType.WILD_DRAW_FOUR))
+
+# Colors a wild can be set to, in Color.value order
+WILD_CHOICES = (Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW)
+
 # --- Card representation ---
 class Card:
     """Represents a single UNO card.
@@ -41,7 +59,12 @@ class Card:
         color (Color): Color enum. Color.WILD for wild cards.
         card_type (CardType): Type of the card (NUMBER, SKIP, etc.)
         number (int|None): For NUMBER type cards, stores the numeric value (0-9).
+
+    Cards are never mutated, so DECK_TEMPLATE holds one instance per distinct
+    face and duplicates in a deck are the same object.
     """
+    __slots__ = ("color", "card_type", "number")
+
     def __init__(self, color, card_type, number=None):
         # Validate inputs
         self.color = color
@@ -78,31 +101,25 @@ class Card:
         - If this card and other_card share the same action type (e.g., both SKIP),
           it's playable (action-card matching).
         """
+        # Enum members are singletons, so identity tests are exact (and cheaper than ==)
         # Wild cards can always be played
-        if self.color == Color.WILD:
+        if self.color is Color.WILD:
             return True
         # Same color as current color
-        if self.color == current_color:
+        if self.color is current_color:
             return True
         # Number cards match by number
-        if self.card_type == CardType.NUMBER and other_card.card_type == CardType.NUMBER:
+        if self.card_type is CardType.NUMBER and other_card.card_type is CardType.NUMBER:
             return self.number == other_card.number
         # Action cards match by type
-        if self.card_type == other_card.card_type and self.card_type != CardType.NUMBER:
+        if self.card_type is other_card.card_type and self.card_type is not CardType.NUMBER:
             return True
         # Otherwise not playable
         return False
     
     def get_color_rgb(self):
         """Return an RGB tuple suitable for rendering card UI (not used by game logic)."""
-        color_map = {
-            Color.RED: (220, 20, 60),
-            Color.BLUE: (30, 144, 255),
-            Color.GREEN: (50, 205, 50),
-            Color.YELLOW: (255, 215, 0),
-            Color.WILD: (50, 50, 50)
-        }
-        return color_map[self.color]
+        return COLOR_RGB[self.color.value]
     
     def get_strategic_value(self):
         """
@@ -130,6 +147,34 @@ class Card:
         else:
             return self.number if self.number is not None else 3
 
+def _build_deck():
+    """The 108 cards of a standard deck, in a fixed (unshuffled) order."""
+    deck = []
+
+    # Add colored cards
+    for color in [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]:
+
+        # One zero per color
+        deck.append(Card(color, CardType.NUMBER, 0))
+
+        # Two of each number 1-9 per color
+        for num in range(1, 10):
+            deck.extend([Card(color, CardType.NUMBER, num)] * 2)
+
+        # Two of each action card per color
+        actions = [Card(color, CardType.SKIP, None),
+                   Card(color, CardType.REVERSE, None),
+                   Card(color, CardType.DRAW_TWO, None)]
+        deck.extend(actions * 2)
+
+    # Wild cards (4 of each)
+    deck.extend([Card(Color.WILD, CardType.WILD, None),
+                 Card(Color.WILD, CardType.WILD_DRAW_FOUR, None)] * 4)
+    return deck
+
+# Built once at import; create_deck() copies it instead of making 108 new Cards
+DECK_TEMPLATE = tuple(_build_deck())
+
 # --- Main UnoGame class (game engine) ---
 class UnoGame:
     """Main game class with with rules for all the cards.
@@ -156,8 +201,12 @@ class UnoGame:
         # turns_played: counts how many card-play turns have occurred
         self.turns_played = 0
 
-         # last_action_cards: rolling window of recent action cards 
-        self.last_action_cards = []
+         # last_action_cards: rolling window of the 5 most recent action cards 
+        self.last_action_cards = deque(maxlen=5)
+
+        # state_version: bumped whenever a hand or the top card changes, so
+        # callers can tell when cached results (e.g. valid cards) are stale
+        self.state_version = 0
 
          # Initialize/reset the game to a starting state
         self.reset()
@@ -174,31 +223,11 @@ class UnoGame:
             - 2 x REVERSE
             - 2 x DRAW_TWO
         - 4 x WILD
-        - 4 x WILD_DRAW_FOUR"""
-
-        deck = []
-
-        # Add colored cards
-        for color in [Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW]:
-
-            # One zero per color
-            deck.append(Card(color, CardType.NUMBER, 0))
-
-            # Two of each number 1-9 per color
-            for num in range(1, 10):
-                deck.extend([Card(color, CardType.NUMBER, num)] * 2)
+        - 4 x WILD_DRAW_FOUR
 
-            # Two of each action card per color
-            for _ in range(2):
-                deck.append(Card(color, CardType.SKIP, None))
-                deck.append(Card(color, CardType.REVERSE, None))
-                deck.append(Card(color, CardType.DRAW_TWO, None))
-
-        # Wild cards (4 of each)
-        for _ in range(4):
-            deck.append(Card(Color.WILD, CardType.WILD, None))
-            deck.append(Card(Color.WILD, CardType.WILD_DRAW_FOUR, None))
-        return deck
+        Cards are never modified once created, so every deck is a copy of
+        DECK_TEMPLATE sharing its Card objects."""
+        return list(DECK_TEMPLATE)
     
     def reset(self):
         """Reset the entire game to an initial state:
@@ -210,9 +239,12 @@ class UnoGame:
         self.deck = self.create_deck()
         random.shuffle(self.deck)
         
-        # Deal 7 cards to each player: player_hand (0) and ai_hand (1)
-        self.player_hand = [self.deck.pop() for _ in range(7)]
-        self.ai_hand = [self.deck.pop() for _ in range(7)]
+        # Deal 7 cards to each player: player_hand (0) and ai_hand (1). One slice off
+        # the end, reversed into the order pop() would hand them out
+        dealt = self.deck[-14:][::-1]
+        del self.deck[-14:]
+        self.player_hand = dealt[:7]
+        self.ai_hand = dealt[7:]
         
         # the first discard/top card is a number card (many UNO rules forbid starting
         # on an action card). If we pop an action/wild, keep popping until we find a number.
@@ -238,7 +270,8 @@ class UnoGame:
         # History and tracking variables
         self.discard_history = [start_card]
         self.turns_played = 0
-        self.last_action_cards = []
+        self.last_action_cards = deque(maxlen=5)
+        self.state_version += 1
     
     # ---- Helper Functions ----
     def get_top_card(self):
@@ -253,21 +286,19 @@ class UnoGame:
         Special case: if pending_draw > 0, only Draw Two and Wild Draw Four may be played
         to stack the penalty.
         """
-        top_card = self.get_top_card()
-        valid_indices = []
-        
         # If there's a pending draw, only allow stacking with DRAW_TWO or WILD_DRAW_FOUR
         if self.pending_draw > 0:
-            for i, card in enumerate(hand):
-                if card.card_type in [CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR]:
-                    valid_indices.append(i)
-            return valid_indices
+            return [i for i, card in enumerate(hand) if card.card_type in STACKABLE_TYPES]
         
-         # Normal play - any card that matches top card by rules (color / number / action-type)
-        for i, card in enumerate(hand):
-            if card.can_play_on(top_card, self.current_color):
-                valid_indices.append(i)
-        return valid_indices
+        # Normal play - same rules as Card.can_play_on, inlined with the top card's
+        # fields hoisted since this runs for every move of every training game
+        top_card = self.get_top_card()
+        top_type, top_number = top_card.card_type, top_card.number
+        current_color = self.current_color
+        wild, number = Color.WILD, CardType.NUMBER
+        return [i for i, card in enumerate(hand)
+                if card.color is wild or card.color is current_color
+                or (card.card_type is top_type and (top_type is not number or card.number == top_number))]
     
     def get_recent_colors(self, n=5):
         """
@@ -304,10 +335,20 @@ class UnoGame:
             self.player_hand.append(card)
         else:
             self.ai_hand.append(card)
+        self.state_version += 1
         return card
     
     def draw_multiple_cards(self, player, count):
         """Draw count cards for player. Returns list of drawn Card objects."""
+        if 0 < count <= len(self.deck):
+            # Enough cards without a reshuffle: slice them off the top in the
+            # order repeated draw_card() pops would give
+            drawn_cards = self.deck[-count:][::-1]
+            del self.deck[-count:]
+            hand = self.player_hand if player == 0 else self.ai_hand
+            hand.extend(drawn_cards)
+            self.state_version += 1
+            return drawn_cards
         drawn_cards = []
         for _ in range(count):
             card = self.draw_card(player)
@@ -344,7 +385,7 @@ class UnoGame:
         if not card.can_play_on(top_card, self.current_color):
             # If there's a pending draw, only Draw Two/Four allowed
             if self.pending_draw > 0:
-                if card.card_type not in [CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR]:
+                if card.card_type not in STACKABLE_TYPES:
                     return False
             else:
                 return False
@@ -352,19 +393,18 @@ class UnoGame:
         # Play the card
         played_card = hand.pop(card_index)
         self.discard_pile.append(played_card)
+        self.state_version += 1
         self.discard_history.append(played_card)
         self.turns_played += 1
         
         # Track action cards
-        if played_card.card_type in [CardType.SKIP, CardType.REVERSE, CardType.DRAW_TWO, 
-                                     CardType.WILD, CardType.WILD_DRAW_FOUR]:
+        if played_card.card_type in ACTION_TYPES:
+            # the deque drops the oldest entry itself
             self.last_action_cards.append(played_card)
-            if len(self.last_action_cards) > 5:
-                self.last_action_cards.pop(0)
         
         # Handle wild cards - need to choose color
         if played_card.color == Color.WILD:
-            if chosen_color:
+            if chosen_color is not None:
                 self.current_color = chosen_color
             else:
                 # Default: choose most common color in hand
@@ -413,11 +453,11 @@ class UnoGame:
         if self.pending_draw > 0:
             opponent = 1 - player
             # Check if current player can counter with Draw Two/Four
-            valid_counters = [i for i, card in enumerate(
-                self.player_hand if player == 0 else self.ai_hand
-            ) if card.card_type in [CardType.DRAW_TWO, CardType.WILD_DRAW_FOUR]]
+            hand = self.player_hand if player == 0 else self.ai_hand
+            # stops at the first Draw Two / Wild Draw Four
+            has_counter = any(card.card_type in STACKABLE_TYPES for card in hand)
             
-            if not valid_counters:
+            if not has_counter:
                 # Must draw the cards
                 drawn = self.draw_multiple_cards(player, self.pending_draw)
                 self.message = f"Player {player} draws {self.pending_draw} cards!"
@@ -435,15 +475,18 @@ class UnoGame:
     
     def choose_color_for_wild(self, hand):
         """Smart color choice for wild cards - pick most common color"""
-        color_counts = {Color.RED: 0, Color.BLUE: 0, Color.GREEN: 0, Color.YELLOW: 0}
+        # counts indexed by Color.value; ties go to the first color in WILD_CHOICES
+        counts = [0, 0, 0, 0]
+        wild = Color.WILD
         for card in hand:
-            if card.color in color_counts:
-                color_counts[card.color] += 1
+            if card.color is not wild:
+                counts[card.color.value] += 1
         
         # Return most common color, or random if empty hand
-        if max(color_counts.values()) > 0:
-            return max(color_counts, key=color_counts.get)
-        return random.choice([Color.RED, Color.BLUE, Color.GREEN, Color.YELLOW])
+        best = max(counts)
+        if best > 0:
+            return WILD_CHOICES[counts.index(best)]
+        return random.choice(list(WILD_CHOICES))
     
     def switch_turn(self):
         """Switch to next player with proper turn flow"""
@@ -496,27 +539,31 @@ class UnoGame:
         
         return stats
     
-    def get_state_for_ai(self, perspective_player=1):
+    def get_state_for_ai(self, perspective_player=1, include_stats=True):
         """
-        Enhanced state representation with action card tracking
+        Enhanced state representation with action card tracking.
+        include_stats=False leaves out 'hand_stats' and 'recent_colors' (the only
+        per-card work here) for training rollouts that don't read them.
         """
         my_hand = self.ai_hand if perspective_player == 1 else self.player_hand
         opponent_hand = self.player_hand if perspective_player == 1 else self.ai_hand
         
-        my_stats = self.get_hand_stats(my_hand)
-        
-        return {
+        state = {
+            # a copy, not the live hand: train_agent scores this state again after
+            # play_card has removed the chosen card
             'hand': my_hand.copy(),
             'top_card': self.get_top_card(),
             'current_color': self.current_color,
             'opponent_card_count': len(opponent_hand),
             'deck_size': len(self.deck),
             'my_card_count': len(my_hand),
-            'hand_stats': my_stats,
-            'recent_colors': self.get_recent_colors(3),
             'turns_played': self.turns_played,
             'game_progress': self.turns_played / 50.0,
             'pending_draw': self.pending_draw,  # NEW: Important for strategy
             'skip_next': self.skip_next,  # NEW: Know if next turn is skipped
             'direction': self.direction  # NEW: Turn direction
-        }
\ No newline at end of file
+        }
+        if include_stats:
+            state['hand_stats'] = self.get_hand_stats(my_hand)
+            state['recent_colors'] = self.get_recent_colors(3)
+        return state
\ No newline at end of file